@@ -153,11 +153,14 @@ class OptimizationConstraints:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParetoPoint:
     """
     Representa un punto individual en el frente de Pareto.
 
+    Usa __slots__: el frente puede tener muchos puntos, y sin __dict__ cada
+    instancia ocupa menos memoria y sus atributos se leen más rápido.
+
     Attributes:
         diameter (float): Diámetro de la antena en metros (m).
         f_d_ratio (float): Relación focal f/D (adimensional).
@@ -12,6 +12,8 @@ Referencias:
 - Rappaport, "Wireless Communications: Principles and Practice", 2nd Edition
 """
 
+import math
+
 import numpy as np
 from typing import Union, Tuple
 from dataclasses import dataclass
@@ -264,7 +266,8 @@ def calculate_free_space_path_loss(distance_km: float, frequency_ghz: float) ->
 
     # Fórmula de Friis para pérdida en espacio libre (ITU-R P.525)
     # FSPL(dB) = 20·log₁₀(d_km) + 20·log₁₀(f_GHz) + 92.45
-    fspl_db = 20.0 * np.log10(distance_km) + 20.0 * np.log10(frequency_ghz) + 92.45
+    # Escalares: math.log10 evita el despacho de ufuncs de NumPy en cada llamada
+    fspl_db = 20.0 * math.log10(distance_km) + 20.0 * math.log10(frequency_ghz) + 92.45
 
     return fspl_db
 
@@ -515,7 +518,7 @@ def validate_range_feasibility(
     achievable_fspl = current_fspl - shortage_db
     # FSPL = 20·log₁₀(d) + 20·log₁₀(f) + 92.45
     # => log₁₀(d) = (FSPL - 20·log₁₀(f) - 92.45) / 20
-    log10_d_max = (achievable_fspl - 20.0 * np.log10(frequency_ghz) - 92.45) / 20.0
+    log10_d_max = (achievable_fspl - 20.0 * math.log10(frequency_ghz) - 92.45) / 20.0
     achievable_range_km = 10.0**log10_d_max
 
     # Mensaje diagnóstico
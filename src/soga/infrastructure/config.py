@@ -12,7 +12,7 @@ from typing import Optional
 import tomllib  # Python 3.11+ (built-in)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhysicsConfig:
     """Configuración de constantes físicas."""
 
@@ -26,7 +26,7 @@ class PhysicsConfig:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Configuración de parámetros de simulación."""
 
@@ -80,7 +80,7 @@ class SimulationConfig:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptimizationConfig:
     """Configuración del algoritmo de optimización."""
 
@@ -102,7 +102,7 @@ class OptimizationConfig:
             raise ValueError(f"La semilla debe ser no negativa, recibido: {self.seed}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserDefaultsConfig:
     """Valores por defecto para parámetros de usuario."""
 
@@ -114,7 +114,29 @@ class UserDefaultsConfig:
     desired_range_km: float
 
 
-@dataclass
+# Rangos realistas de los parámetros de link budget: (campo, mínimo, máximo, mensaje)
+_LINK_BUDGET_BOUNDS = (
+    ("tx_power_dbm", -100, 60, "Potencia TX fuera de rango realista [-100, 60] dBm"),
+    (
+        "rx_sensitivity_dbm",
+        -150,
+        -20,
+        "Sensibilidad RX fuera de rango realista [-150, -20] dBm",
+    ),
+    ("rx_noise_figure_db", 0, 20, "Figura de ruido fuera de rango realista [0, 20] dB"),
+    ("required_snr_db", 0, 30, "SNR requerido fuera de rango realista [0, 30] dB"),
+    ("fade_margin_db", 0, 40, "Margen de fade fuera de rango realista [0, 40] dB"),
+    (
+        "implementation_loss_db",
+        0,
+        20,
+        "Pérdidas de implementación fuera de rango [0, 20] dB",
+    ),
+    ("min_link_margin_db", 0, 20, "Margen mínimo de link fuera de rango [0, 20] dB"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class LinkBudgetConfig:
     """Parámetros de link budget para validación de comunicación."""
 
@@ -128,44 +150,20 @@ class LinkBudgetConfig:
 
     def __post_init__(self):
         """Valida que los parámetros de link budget sean correctos."""
-        if self.tx_power_dbm < -100 or self.tx_power_dbm > 60:
-            raise ValueError(
-                f"Potencia TX fuera de rango realista [-100, 60] dBm: {self.tx_power_dbm}"
-            )
-        if self.rx_sensitivity_dbm > -20 or self.rx_sensitivity_dbm < -150:
-            raise ValueError(
-                f"Sensibilidad RX fuera de rango realista [-150, -20] dBm: {self.rx_sensitivity_dbm}"
-            )
-        if self.rx_noise_figure_db < 0 or self.rx_noise_figure_db > 20:
-            raise ValueError(
-                f"Figura de ruido fuera de rango realista [0, 20] dB: {self.rx_noise_figure_db}"
-            )
-        if self.required_snr_db < 0 or self.required_snr_db > 30:
-            raise ValueError(
-                f"SNR requerido fuera de rango realista [0, 30] dB: {self.required_snr_db}"
-            )
-        if self.fade_margin_db < 0 or self.fade_margin_db > 40:
-            raise ValueError(
-                f"Margen de fade fuera de rango realista [0, 40] dB: {self.fade_margin_db}"
-            )
-        if self.implementation_loss_db < 0 or self.implementation_loss_db > 20:
-            raise ValueError(
-                f"Pérdidas de implementación fuera de rango [0, 20] dB: {self.implementation_loss_db}"
-            )
-        if self.min_link_margin_db < 0 or self.min_link_margin_db > 20:
-            raise ValueError(
-                f"Margen mínimo de link fuera de rango [0, 20] dB: {self.min_link_margin_db}"
-            )
+        for name, low, high, message in _LINK_BUDGET_BOUNDS:
+            value = getattr(self, name)
+            if not low <= value <= high:
+                raise ValueError(f"{message}: {value}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegulatoryConfig:
     """Límites regulatorios."""
 
     max_eirp_dbm: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RealisticLimitsConfig:
     """Límites realistas para antenas parabólicas de 2.4 GHz."""
 
@@ -179,7 +177,7 @@ class RealisticLimitsConfig:
     max_range_km: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Configuración completa de la aplicación."""
 
@@ -192,6 +190,18 @@ class AppConfig:
     realistic_limits: RealisticLimitsConfig
 
 
+# Secciones del archivo TOML, en el orden de los campos de AppConfig
+_CONFIG_SECTIONS = (
+    "physics",
+    "simulation",
+    "optimization",
+    "user_defaults",
+    "link_budget",
+    "regulatory",
+    "realistic_limits",
+)
+
+
 class ConfigLoader:
     """
     Cargador de configuración desde archivos TOML.
@@ -252,17 +262,13 @@ class ConfigLoader:
         Encuentra el archivo de configuración por defecto.
 
         Busca config.toml en el directorio raíz del proyecto
-        (dos niveles arriba desde este archivo).
+        (tres niveles arriba desde este archivo). La ruta se resuelve
+        una sola vez al importar el módulo.
 
         Returns:
             Path al archivo config.toml.
         """
-        # Ubicación de este archivo: src/soga/infrastructure/config.py
-        # Directorio raíz: ../../../
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent.parent
-        config_path = project_root / cls.DEFAULT_CONFIG_FILENAME
-        return config_path
+        return _DEFAULT_CONFIG_PATH
 
     @classmethod
     def _build_config(cls, data: dict) -> AppConfig:
@@ -276,60 +282,31 @@ class ConfigLoader:
             AppConfig validado.
 
         Raises:
-            KeyError: Si faltan secciones o claves requeridas.
-            TypeError: Si los tipos de datos son incorrectos.
+            KeyError: Si faltan secciones requeridas.
+            TypeError: Si faltan claves, sobran claves desconocidas o los
+                tipos de datos son incorrectos.
         """
-        physics = PhysicsConfig(speed_of_light=data["physics"]["speed_of_light"])
-
-        simulation = SimulationConfig(
-            frequency_ghz=data["simulation"]["frequency_ghz"],
-            aperture_efficiency=data["simulation"]["aperture_efficiency"],
-            beamwidth_k_factor=data["simulation"]["beamwidth_k_factor"],
-            reflector_areal_density_kg_per_m2=data["simulation"]["reflector_areal_density_kg_per_m2"],
-            fixed_component_weight_kg=data["simulation"]["fixed_component_weight_kg"],
-            efficiency_peak=data["simulation"]["efficiency_peak"],
-            optimal_f_d_ratio=data["simulation"]["optimal_f_d_ratio"],
-            curvature_low_fd=data["simulation"]["curvature_low_fd"],
-            curvature_high_fd=data["simulation"]["curvature_high_fd"],
-        )
-
-        optimization = OptimizationConfig(
-            population_size=data["optimization"]["population_size"],
-            max_generations=data["optimization"]["max_generations"],
-            seed=data["optimization"]["seed"],
-        )
-
-        user_defaults = UserDefaultsConfig(
-            min_diameter_m=data["user_defaults"]["min_diameter_m"],
-            max_diameter_m=data["user_defaults"]["max_diameter_m"],
-            max_payload_g=data["user_defaults"]["max_payload_g"],
-            min_f_d_ratio=data["user_defaults"]["min_f_d_ratio"],
-            max_f_d_ratio=data["user_defaults"]["max_f_d_ratio"],
-            desired_range_km=data["user_defaults"]["desired_range_km"],
-        )
-
-        link_budget = LinkBudgetConfig(
-            tx_power_dbm=data["link_budget"]["tx_power_dbm"],
-            rx_sensitivity_dbm=data["link_budget"]["rx_sensitivity_dbm"],
-            rx_noise_figure_db=data["link_budget"]["rx_noise_figure_db"],
-            required_snr_db=data["link_budget"]["required_snr_db"],
-            fade_margin_db=data["link_budget"]["fade_margin_db"],
-            implementation_loss_db=data["link_budget"]["implementation_loss_db"],
-            min_link_margin_db=data["link_budget"]["min_link_margin_db"],
-        )
-
-        regulatory = RegulatoryConfig(max_eirp_dbm=data["regulatory"]["max_eirp_dbm"])
-
-        realistic_limits = RealisticLimitsConfig(
-            min_diameter_m=data["realistic_limits"]["min_diameter_m"],
-            max_diameter_m=data["realistic_limits"]["max_diameter_m"],
-            min_payload_g=data["realistic_limits"]["min_payload_g"],
-            max_payload_g=data["realistic_limits"]["max_payload_g"],
-            min_f_d_ratio=data["realistic_limits"]["min_f_d_ratio"],
-            max_f_d_ratio=data["realistic_limits"]["max_f_d_ratio"],
-            min_range_km=data["realistic_limits"]["min_range_km"],
-            max_range_km=data["realistic_limits"]["max_range_km"],
-        )
+        missing_sections = [name for name in _CONFIG_SECTIONS if name not in data]
+        if missing_sections:
+            raise KeyError(f"Faltan secciones requeridas: {missing_sections}")
+
+        (
+            physics_data,
+            simulation_data,
+            optimization_data,
+            user_defaults_data,
+            link_budget_data,
+            regulatory_data,
+            realistic_limits_data,
+        ) = (data[name] for name in _CONFIG_SECTIONS)
+
+        physics = PhysicsConfig(**physics_data)
+        simulation = SimulationConfig(**simulation_data)
+        optimization = OptimizationConfig(**optimization_data)
+        user_defaults = UserDefaultsConfig(**user_defaults_data)
+        link_budget = LinkBudgetConfig(**link_budget_data)
+        regulatory = RegulatoryConfig(**regulatory_data)
+        realistic_limits = RealisticLimitsConfig(**realistic_limits_data)
 
         return AppConfig(
             physics=physics,
@@ -342,6 +319,12 @@ class ConfigLoader:
         )
 
 
+# Ubicación de este archivo: src/soga/infrastructure/config.py
+# Directorio raíz: ../../../
+_DEFAULT_CONFIG_PATH = (
+    Path(__file__).resolve().parents[3] / ConfigLoader.DEFAULT_CONFIG_FILENAME
+)
+
 # Instancia global de configuración (singleton lazy)
 _config: Optional[AppConfig] = None
 
@@ -3,16 +3,87 @@ Módulo de entrada/salida de archivos.
 
 Proporciona funcionalidades para:
 - Guardar y cargar sesiones de trabajo en formato JSON
+- Guardar y cargar sesiones en formato binario rápido (pickle protocolo 5)
 - Exportar resultados en formatos 2D (JSON, CSV)
 """
 
+import base64
+import copy
 import csv
+import functools
 import json
+import math
+import os
+import pickle
+import struct
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, TextIO, Tuple, Union
+
+import numpy as np
 
 from soga.core.models import AntennaGeometry, OptimizationResult, PerformanceMetrics
 
+try:
+    import orjson  # Opcional: codificador JSON en C, mucho más rápido
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+# Prefijo de longitud (uint64 little-endian) de cada bloque del formato rápido
+_FRAME_HEADER = struct.Struct("<Q")
+
+# Fila del CSV de convergencia: generación y mejor ganancia (dBi)
+_CONVERGENCE_ROW = "{},{:.6f}\r\n"
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """
+    Adapta un valor para json estándar con el mismo criterio que orjson.
+
+    Los arrays y escalares de NumPy pasan a tipos nativos y los flotantes no
+    finitos (NaN, ±inf) a None; el resto de objetos se devuelve sin cambios
+    para que json lance TypeError si no es serializable.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return _to_json_compatible(value.tolist())
+    return value
+
+
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """Serializa a JSON indentado en UTF-8, usando orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(
+        _to_json_compatible(data), indent=2, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Deserializa JSON desde bytes, usando orjson si está disponible."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_history(history: List[float]) -> str:
+    """Empaqueta el historial como float64 little-endian codificado en base64."""
+    packed = np.asarray(history, dtype="<f8").tobytes()
+    return base64.b64encode(packed).decode("ascii")
+
+
+def _decode_history(encoded: str) -> List[float]:
+    """Desempaqueta un historial codificado con _encode_history."""
+    packed = base64.b64decode(encoded, validate=True)
+    return np.frombuffer(packed, dtype="<f8").tolist()
+
 
 class SessionManager:
     """
@@ -49,28 +120,37 @@ class SessionManager:
             ... )
         """
         # Construir el diccionario de sesión
+        geometry = optimization_result.optimal_geometry
+        performance = optimization_result.performance_metrics
         session_data = {
             "user_parameters": user_parameters,
             "results": {
                 "geometry": {
-                    "diameter": optimization_result.optimal_geometry.diameter,
-                    "focal_length": optimization_result.optimal_geometry.focal_length,
-                    "depth": optimization_result.optimal_geometry.depth,
-                    "f_d_ratio": optimization_result.optimal_geometry.f_d_ratio,
+                    "diameter": geometry.diameter,
+                    "focal_length": geometry.focal_length,
+                    "depth": geometry.depth,
+                    "f_d_ratio": geometry.f_d_ratio,
                 },
                 "performance": {
-                    "gain": optimization_result.performance_metrics.gain,
-                    "beamwidth": optimization_result.performance_metrics.beamwidth,
+                    "gain": performance.gain,
+                    "beamwidth": performance.beamwidth,
                 },
-                "convergence_history": optimization_result.convergence_history,
+                # Historial empaquetado en binario: ~8 bytes por generación
+                # frente a ~18 caracteres por float en texto JSON
+                "convergence_history_b64": _encode_history(
+                    optimization_result.convergence_history
+                ),
             },
         }
 
-        # Guardar como JSON
+        # Guardar como JSON: serializar completo y escribir de una vez en un
+        # archivo temporal que reemplaza al destino (escritura atómica)
+        temp_path = filepath.with_name(filepath.name + ".tmp")
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            temp_path.write_bytes(_dumps_json(session_data))
+            os.replace(temp_path, filepath)
         except (IOError, TypeError) as e:
+            temp_path.unlink(missing_ok=True)
             raise IOError(f"Error al guardar la sesión en {filepath}: {e}") from e
 
     @staticmethod
@@ -88,7 +168,7 @@ class SessionManager:
                     "results": {
                         "geometry": {...},
                         "performance": {...},
-                        "convergence_history": [...]
+                        "convergence_history_b64": "..."
                     }
                 }
 
@@ -104,8 +184,8 @@ class SessionManager:
             raise FileNotFoundError(f"Archivo de sesión no encontrado: {filepath}")
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            with open(filepath, "rb") as f:
+                session_data = _loads_json(f.read())
         except json.JSONDecodeError as e:
             raise ValueError(f"Archivo JSON inválido en {filepath}: {e}") from e
         except IOError as e:
@@ -120,6 +200,35 @@ class SessionManager:
 
         return session_data
 
+    @staticmethod
+    def load_session_cached(filepath: Path) -> Dict[str, Any]:
+        """
+        Carga una sesión reutilizando el resultado si el archivo no cambió.
+
+        La caché se indexa por ruta y fecha de modificación (st_mtime_ns),
+        por lo que editar o reemplazar el archivo invalida la entrada.
+
+        Args:
+            filepath: Ruta al archivo de sesión.
+
+        Returns:
+            Diccionario con la sesión cargada (misma estructura que
+            load_session). Es una copia propia del llamador: modificarla no
+            altera la entrada en caché.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si el archivo JSON es inválido.
+        """
+        try:
+            mtime_ns = filepath.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise FileNotFoundError(
+                f"Archivo de sesión no encontrado: {filepath}"
+            ) from e
+
+        return copy.deepcopy(_load_session_cached(str(filepath), mtime_ns))
+
     @staticmethod
     def reconstruct_result(session_data: Dict[str, Any]) -> OptimizationResult:
         """
@@ -151,7 +260,11 @@ class SessionManager:
                 beamwidth=results["performance"]["beamwidth"],
             )
 
-            convergence = results.get("convergence_history", [])
+            # Sesiones antiguas guardan el historial como lista JSON
+            if "convergence_history_b64" in results:
+                convergence = _decode_history(results["convergence_history_b64"])
+            else:
+                convergence = results.get("convergence_history", [])
 
             return OptimizationResult(
                 optimal_geometry=geometry,
@@ -161,6 +274,124 @@ class SessionManager:
         except (KeyError, TypeError, ValueError) as e:
             raise ValueError(f"Error al reconstruir el resultado: {e}") from e
 
+    @staticmethod
+    def save_session_fast(
+        filepath: Path,
+        user_parameters: Dict[str, Any],
+        optimization_result: OptimizationResult,
+    ) -> None:
+        """
+        Guarda una sesión en formato binario con pickle (protocolo 5).
+
+        El historial de convergencia se guarda como ndarray fuera de banda:
+        su buffer se escribe tal cual a continuación del pickle, sin
+        codificar float a float. Pensado para el traspaso entre procesos o
+        páginas; para exportaciones legibles usar save_session (JSON).
+
+        Formato: bloques [longitud uint64 LE][bytes], primero el pickle y
+        después cada buffer fuera de banda en orden.
+
+        Args:
+            filepath: Ruta donde guardar la sesión (extensión .pkl recomendada).
+            user_parameters: Parámetros de entrada del usuario.
+            optimization_result: Resultado de la optimización.
+
+        Raises:
+            IOError: Si no se puede escribir el archivo.
+        """
+        session_data = {
+            "user_parameters": user_parameters,
+            "optimal_geometry": optimization_result.optimal_geometry,
+            "performance_metrics": optimization_result.performance_metrics,
+            "convergence_history": np.asarray(
+                optimization_result.convergence_history, dtype=np.float64
+            ),
+        }
+
+        buffers: List[pickle.PickleBuffer] = []
+        temp_path = filepath.with_name(filepath.name + ".tmp")
+        try:
+            payload = pickle.dumps(
+                session_data, protocol=5, buffer_callback=buffers.append
+            )
+            with open(temp_path, "wb") as f:
+                f.write(_FRAME_HEADER.pack(len(payload)))
+                f.write(payload)
+                for buffer in buffers:
+                    raw = buffer.raw()
+                    f.write(_FRAME_HEADER.pack(raw.nbytes))
+                    f.write(raw)
+            os.replace(temp_path, filepath)
+        except (IOError, pickle.PicklingError) as e:
+            temp_path.unlink(missing_ok=True)
+            raise IOError(f"Error al guardar la sesión en {filepath}: {e}") from e
+
+    @staticmethod
+    def load_session_fast(
+        filepath: Path,
+    ) -> Tuple[Dict[str, Any], OptimizationResult]:
+        """
+        Carga una sesión guardada con save_session_fast.
+
+        Solo debe usarse con archivos generados por la propia aplicación:
+        pickle puede ejecutar código arbitrario al deserializar.
+
+        Args:
+            filepath: Ruta al archivo de sesión binario.
+
+        Returns:
+            Tupla (user_parameters, optimization_result).
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si el archivo está truncado o no es una sesión válida.
+        """
+        if not filepath.exists():
+            raise FileNotFoundError(f"Archivo de sesión no encontrado: {filepath}")
+
+        try:
+            with open(filepath, "rb") as f:
+                data = memoryview(f.read())
+        except IOError as e:
+            raise IOError(f"Error al leer el archivo {filepath}: {e}") from e
+
+        try:
+            frames = []
+            offset = 0
+            while offset < len(data):
+                (size,) = _FRAME_HEADER.unpack_from(data, offset)
+                offset += _FRAME_HEADER.size
+                if offset + size > len(data):
+                    raise ValueError("bloque truncado")
+                frames.append(data[offset : offset + size])
+                offset += size
+
+            if not frames:
+                raise ValueError("archivo vacío")
+
+            session_data = pickle.loads(frames[0], buffers=frames[1:])
+            return session_data["user_parameters"], OptimizationResult(
+                optimal_geometry=session_data["optimal_geometry"],
+                performance_metrics=session_data["performance_metrics"],
+                convergence_history=session_data["convergence_history"].tolist(),
+            )
+        except (
+            struct.error,
+            pickle.UnpicklingError,
+            KeyError,
+            TypeError,
+            ValueError,
+            AttributeError,
+            EOFError,
+        ) as e:
+            raise ValueError(f"Sesión binaria inválida en {filepath}: {e}") from e
+
+
+@functools.lru_cache(maxsize=128)
+def _load_session_cached(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """Carga una sesión; mtime_ns solo participa en la clave de la caché."""
+    return SessionManager.load_session(Path(filepath))
+
 
 class ResultsExporter:
     """
@@ -213,37 +444,67 @@ class ResultsExporter:
             "beamwidth_deg",
         ]
 
+        # Validar que todas las claves requeridas existen antes de escribir,
+        # para no dejar un archivo a medio escribir
+        for result in results:
+            missing_keys = set(fieldnames) - result.keys()
+            if missing_keys:
+                raise ValueError(
+                    f"Faltan claves requeridas en resultado: {missing_keys}"
+                )
+
         try:
             with open(filepath, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for result in results:
-                    # Validar que todas las claves requeridas existen
-                    missing_keys = set(fieldnames) - set(result.keys())
-                    if missing_keys:
-                        raise ValueError(
-                            f"Faltan claves requeridas en resultado: {missing_keys}"
-                        )
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
 
-                    # Escribir fila con solo las columnas requeridas
-                    row = {key: result[key] for key in fieldnames}
-                    writer.writerow(row)
+                # Escribir todas las filas con solo las columnas requeridas
+                writer.writerows(
+                    [result[key] for key in fieldnames] for result in results
+                )
 
         except (IOError, OSError) as e:
             raise IOError(f"Error al guardar el archivo CSV en {filepath}: {e}") from e
 
+    @staticmethod
+    def export_to_json_bytes(data: Dict[str, Any]) -> bytes:
+        """
+        Serializa resultados a JSON indentado en UTF-8, listo para descargar.
+
+        Usa orjson si está instalado (extra ``fast``) y el módulo json estándar
+        en caso contrario. Ambas rutas aceptan arrays y escalares de NumPy y
+        escriben los flotantes no finitos (NaN, ±inf) como null; solo pueden
+        diferir en el espaciado.
+
+        Args:
+            data: Diccionario serializable con parámetros y resultados.
+
+        Returns:
+            Documento JSON codificado en UTF-8.
+
+        Raises:
+            ValueError: Si los datos no son serializables.
+
+        Examples:
+            >>> payload = ResultsExporter.export_to_json_bytes({"gain_dbi": 28.5})
+        """
+        try:
+            return _dumps_json(data)
+        except TypeError as e:
+            raise ValueError(f"Datos no serializables a JSON: {e}") from e
+
     @staticmethod
     def export_convergence_to_csv(
         convergence_history: List[float],
-        filepath: Path,
+        filepath: Union[Path, TextIO],
     ) -> None:
         """
         Exporta el historial de convergencia a formato CSV.
 
         Args:
             convergence_history: Lista con los valores de convergencia por generación.
-            filepath: Ruta donde guardar el archivo CSV.
+            filepath: Ruta donde guardar el archivo CSV, o un objeto de texto
+                abierto (p. ej. io.StringIO) para exportar en memoria.
 
         Raises:
             IOError: Si no se puede escribir el archivo.
@@ -255,17 +516,26 @@ class ResultsExporter:
             ...     history,
             ...     Path("convergence.csv")
             ... )
+            >>> buffer = io.StringIO()
+            >>> ResultsExporter.export_convergence_to_csv(history, buffer)
         """
-        if not convergence_history:
+        if len(convergence_history) == 0:
             raise ValueError("El historial de convergencia está vacío")
 
-        try:
-            with open(filepath, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["generation", "best_gain_dbi"])
+        history = np.asarray(convergence_history, dtype=np.float64).tolist()
+
+        # Esquema fijo (entero, flotante): el documento completo se arma con un
+        # único formato precompilado, mismo formato que csv.writer (CRLF)
+        text = "generation,best_gain_dbi\r\n" + "".join(
+            map(_CONVERGENCE_ROW.format, range(len(history)), history)
+        )
 
-                for generation, gain in enumerate(convergence_history):
-                    writer.writerow([generation, gain])
+        try:
+            if hasattr(filepath, "write"):
+                filepath.write(text)
+            else:
+                with open(filepath, "w", newline="", encoding="utf-8") as f:
+                    f.write(text)
 
         except (IOError, OSError) as e:
             raise IOError(
@@ -9,14 +9,25 @@ Author: SOGA Development Team
 License: MIT
 """
 
+import os
 import sys
-from pathlib import Path
+from types import MappingProxyType
 
 import streamlit as st
 
-# Ensure the backend is importable
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Ensure the backend is importable (guarded: the script re-runs on every interaction)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+# App menu entries (read-only view; Streamlit only iterates over them)
+_MENU_ITEMS = MappingProxyType(
+    {
+        "Get Help": "https://github.com/Steve-2045/SOGA",
+        "Report a bug": "https://github.com/Steve-2045/SOGA/issues",
+        "About": "SOGA: Optimización de Antenas para Drones en Agricultura de Precisión",
+    }
+)
 
 # Page configuration - must be first Streamlit command
 st.set_page_config(
@@ -24,91 +35,106 @@ st.set_page_config(
     page_icon="📡",
     layout="wide",
     initial_sidebar_state="expanded",
-    menu_items={
-        "Get Help": "https://github.com/Steve-2045/SOGA",
-        "Report a bug": "https://github.com/Steve-2045/SOGA/issues",
-        "About": "SOGA: Optimización de Antenas para Drones en Agricultura de Precisión",
-    },
+    menu_items=_MENU_ITEMS,
 )
 
 
-def main() -> None:
-    """Main home page rendering function."""
-    # Title and header
-    st.title("📡 SOGA: Software de Optimización Geométrica de Antenas")
-    st.markdown(
-        "### Antenas Parabólicas para Comunicación con Drones en Agricultura de Precisión"
-    )
+# Static page content, kept out of main() so the layout reads at a glance
+_WELCOME_MD = """
+## Bienvenido
 
-    st.markdown("---")
+Herramienta avanzada de optimización multi-objetivo para diseño de antenas parabólicas
+direccionales de 2.4 GHz para comunicación terrestre con drones en agricultura de precisión.
 
-    # Introduction section
-    col1, col2 = st.columns([2, 1])
+### Características Principales
 
-    with col1:
-        st.markdown(
-            """
-            ## Bienvenido
+- **Optimización Multi-Objetivo NSGA-II**: Algoritmo genético de última generación para
+  balancear ganancia, peso y geometría.
 
-            Herramienta avanzada de optimización multi-objetivo para diseño de antenas parabólicas
-            direccionales de 2.4 GHz para comunicación terrestre con drones en agricultura de precisión.
+- **Fundamentos Científicos**: Basado en las ecuaciones de Balanis y Kraus para diseño
+  de antenas parabólicas de alta precisión.
 
-            ### Características Principales
+- **Validación Física**: Todas las configuraciones se validan contra límites realistas
+  de fabricación y operación práctica.
 
-            - **Optimización Multi-Objetivo NSGA-II**: Algoritmo genético de última generación para
-              balancear ganancia, peso y geometría.
+- **Análisis de Convergencia**: Visualización completa del proceso de optimización
+  generación por generación.
 
-            - **Fundamentos Científicos**: Basado en las ecuaciones de Balanis y Kraus para diseño
-              de antenas parabólicas de alta precisión.
+### Navegación
 
-            - **Validación Física**: Todas las configuraciones se validan contra límites realistas
-              de fabricación y operación práctica.
+Utilice la **barra lateral** para acceder a las diferentes páginas:
 
-            - **Análisis de Convergencia**: Visualización completa del proceso de optimización
-              generación por generación.
+- 🚀 **Nueva Optimización**: Configure y ejecute simulaciones de optimización
+- 📚 **Análisis de Sesiones**: Compare y analice múltiples resultados guardados
+- ℹ️ **Acerca del Proyecto**: Documentación técnica y fundamentos científicos
 
-            ### Navegación
+---
 
-            Utilice la **barra lateral** para acceder a las diferentes páginas:
+### Inicio Rápido
 
-            - 🚀 **Nueva Optimización**: Configure y ejecute simulaciones de optimización
-            - 📚 **Análisis de Sesiones**: Compare y analice múltiples resultados guardados
-            - ℹ️ **Acerca del Proyecto**: Documentación técnica y fundamentos científicos
+1. Vaya a **🚀 Nueva Optimización**
+2. Configure los parámetros de diseño
+3. Ejecute la optimización
+4. Analice los resultados y métricas de rendimiento
+5. Descargue o exporte los datos
+"""
 
-            ---
+_FOOTER_HTML = """
+<div style='text-align: center; color: #667eea;'>
+    <p>SOGA v1.0 | Desarrollado con Streamlit y optimización evolutiva NSGA-II</p>
+    <p>Para más información, consulta la documentación completa en la carpeta <code>docs/</code></p>
+    <p>GitHub: <a href="https://github.com/Steve-2045/SOGA" target="_blank">https://github.com/Steve-2045/SOGA</a></p>
+</div>
+"""
 
-            ### Inicio Rápido
 
-            1. Vaya a **🚀 Nueva Optimización**
-            2. Configure los parámetros de diseño
-            3. Ejecute la optimización
-            4. Analice los resultados y métricas de rendimiento
-            5. Descargue o exporte los datos
-            """
-        )
+@st.fragment
+def _welcome_section() -> None:
+    """Render the static welcome and navigation text."""
+    st.markdown(_WELCOME_MD)
 
-    with col2:
-        # Quick stats
-        st.markdown("### Especificaciones Técnicas")
-        st.metric("Frecuencia de Operación", "2.4 GHz", help="Banda ISM estándar")
-        st.metric("Rango de Diámetros", "5 cm - 3 m", help="Límites de fabricación")
-        st.metric(
-            "Algoritmo", "NSGA-II", help="Non-dominated Sorting Genetic Algorithm II"
-        )
-
-    # Footer
+
+@st.fragment
+def _specs_section() -> None:
+    """Render the static technical specifications column."""
+    st.markdown("### Especificaciones Técnicas")
+    st.metric("Frecuencia de Operación", "2.4 GHz", help="Banda ISM estándar")
+    st.metric("Rango de Diámetros", "5 cm - 3 m", help="Límites de fabricación")
+    st.metric(
+        "Algoritmo", "NSGA-II", help="Non-dominated Sorting Genetic Algorithm II"
+    )
+
+
+@st.fragment
+def _footer() -> None:
+    """Render the page footer."""
     st.markdown("---")
+    # Raw HTML: st.html bypasses the markdown pipeline entirely
+    st.html(_FOOTER_HTML)
+
+
+def main() -> None:
+    """Main home page rendering function."""
+    # Title and header
+    st.title("📡 SOGA: Software de Optimización Geométrica de Antenas")
     st.markdown(
-        """
-        <div style='text-align: center; color: #667eea;'>
-            <p>SOGA v1.0 | Desarrollado con Streamlit y optimización evolutiva NSGA-II</p>
-            <p>Para más información, consulta la documentación completa en la carpeta <code>docs/</code></p>
-            <p>GitHub: <a href="https://github.com/Steve-2045/SOGA" target="_blank">https://github.com/Steve-2045/SOGA</a></p>
-        </div>
-        """,
-        unsafe_allow_html=True,
+        "### Antenas Parabólicas para Comunicación con Drones en Agricultura de Precisión"
     )
 
+    st.markdown("---")
+
+    # Introduction section
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        _welcome_section()
+
+    with col2:
+        # Quick stats
+        _specs_section()
+
+    _footer()
+
 
 if __name__ == "__main__":
     main()
@@ -9,12 +9,18 @@ Author: SOGA Development Team
 License: MIT
 """
 
+import functools
+import gzip
 import io
-import json
+import math
+import operator
 import sys
+import uuid
+import zipfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
@@ -23,7 +29,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from soga.app.facade import ApplicationFacade, FacadeValidationError
-from soga.infrastructure.config import get_config
+from soga.infrastructure.config import AppConfig, get_config
 from soga.infrastructure.file_io import ResultsExporter
 
 # Page configuration
@@ -34,32 +40,140 @@ st.set_page_config(
 )
 
 
+# Dark theme shared by every chart on this page. Passed per figure rather than
+# set as pio.templates.default, which would restyle the other pages' charts too;
+# it also replaces Plotly's much larger default template in the figure JSON.
+SOGA_DARK_TEMPLATE = go.layout.Template(
+    layout={
+        "plot_bgcolor": "#1a1f2e",
+        "paper_bgcolor": "#1a1f2e",
+        "font": {"color": "#e2e8f0"},
+        "xaxis": {"gridcolor": "#2d3748", "color": "#e2e8f0"},
+        "yaxis": {"gridcolor": "#2d3748", "color": "#e2e8f0"},
+    }
+)
+
+# Legend box in the top-left corner, matching the dark background
+_DARK_LEGEND = {
+    "x": 0.02,
+    "y": 0.98,
+    "bgcolor": "rgba(26, 31, 46, 0.8)",
+    "bordercolor": "#667eea",
+    "borderwidth": 1,
+}
+
+# Reflector weight in grams is _K_D2W * areal_density * D² (π/4 · D² area, kg → g)
+_K_D2W = math.pi * 0.25 * 1000.0
+
+# Plotly client config shared by every chart on this page
+_PLOTLY_CONFIG = {
+    "displaylogo": False,
+    "modeBarButtonsToRemove": ["lasso2d", "select2d"],
+    "scrollZoom": True,
+}
+
+# Icon shown next to the infeasibility diagnosis, keyed by severity
+_SEVERITY_ICONS = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "unknown": "⚠️",
+}
+
+
+@st.cache_resource
 def load_configuration():
-    """Load SOGA configuration with caching to avoid redundant reads."""
-    if "config" not in st.session_state:
-        st.session_state.config = get_config()
-    return st.session_state.config
+    """Load SOGA configuration once and share it across all sessions (read-only)."""
+    return get_config()
+
+
+@st.cache_resource
+def _facade() -> ApplicationFacade:
+    """Build the application facade once; its engine holds no per-run state."""
+    return ApplicationFacade()
+
+
+def lttb_downsample(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line series with Largest-Triangle-Three-Buckets (LTTB).
+
+    Keeps the first and last points and, from each intermediate bucket, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape.
+
+    Args:
+        x: X values (monotonically increasing)
+        y: Y values, same length as x
+        max_points: Maximum number of points to keep (>= 3)
 
+    Returns:
+        Tuple (x, y) with at most max_points points
+    """
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return x, y
+
+    # Bucket edges for the n - 2 interior points
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+
+    keep = np.empty(max_points, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    prev = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_start = end if i + 2 < len(edges) else n - 1
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs(
+            (x[prev] - avg_x) * (bucket_y - y[prev])
+            - (x[prev] - bucket_x) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        keep[i + 1] = prev
 
-def create_convergence_plot(convergence_history: list[float]) -> go.Figure:
+    return x[keep], y[keep]
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def create_convergence_plot(
+    convergence_history: list[float], max_points: int = 2000
+) -> go.Figure:
     """
     Create an interactive Plotly line chart for convergence history.
 
     Args:
         convergence_history: List of best gain values per generation
+        max_points: Longer histories are downsampled with LTTB to this
+            many points before plotting
 
     Returns:
         Plotly Figure object
     """
-    generations = list(range(len(convergence_history)))
+    gains = np.asarray(convergence_history, dtype=np.float64)
+    generations = np.arange(len(gains), dtype=np.int32)
+    # Per-point markers only help on short runs; on long ones they clutter
+    # the curve without making it easier to read
+    mode = "lines+markers" if len(gains) <= 500 else "lines"
+    generations, gains = lttb_downsample(generations, gains, max_points)
+    # float32 is ample for a 2-decimal dBi readout and halves the payload
+    gains = gains.astype(np.float32)
 
     fig = go.Figure()
 
+    # WebGL trace: long runs stay responsive on hover/zoom, unlike SVG
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=generations,
-            y=convergence_history,
-            mode="lines+markers",
+            y=gains,
+            mode=mode,
             name="Mejor Ganancia",
             line={"color": "#667eea", "width": 3},
             marker={"size": 6, "color": "#667eea"},
@@ -72,28 +186,34 @@ def create_convergence_plot(convergence_history: list[float]) -> go.Figure:
             "text": "Convergencia del Algoritmo NSGA-II",
             "x": 0.5,
             "xanchor": "center",
-            "font": {"size": 20, "color": "#e2e8f0"},
+            "font": {"size": 20},
         },
         xaxis={
             "title": "Generación",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
         },
         yaxis={
             "title": "Mejor Ganancia (dBi)",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
         },
-        plot_bgcolor="#1a1f2e",
-        paper_bgcolor="#1a1f2e",
-        font={"color": "#e2e8f0"},
+        template=SOGA_DARK_TEMPLATE,
         hovermode="x unified",
+        spikedistance=0,
+        uirevision="fixed",
         showlegend=False,
     )
 
     return fig
 
 
+# Field layout used to unpack ParetoPoint objects into NumPy columns
+_PARETO_DTYPE = np.dtype(
+    [("weight", "f8"), ("gain", "f8"), ("diameter", "f8"), ("f_d_ratio", "f8")]
+)
+# Attribute getter matching the _PARETO_DTYPE field order
+_PARETO_FIELDS = operator.attrgetter("weight", "gain", "diameter", "f_d_ratio")
+# Subset used for the Pareto statistics panel
+_PARETO_STATS_DTYPE = np.dtype([("gain", "f8"), ("weight", "f8")])
+
+
 def create_pareto_front_plot(pareto_front: list, optimal_point: dict) -> go.Figure:
     """
     Create an interactive Plotly scatter plot for the Pareto front.
@@ -110,19 +230,22 @@ def create_pareto_front_plot(pareto_front: list, optimal_point: dict) -> go.Figu
         fig = go.Figure()
         fig.update_layout(
             title="No hay datos del frente de Pareto disponibles",
-            plot_bgcolor="#1a1f2e",
-            paper_bgcolor="#1a1f2e",
+            template=SOGA_DARK_TEMPLATE,
         )
         return fig
 
-    # Extract data from pareto_front
-    weights_kg = [point.weight for point in pareto_front]
-    gains_dbi = [point.gain for point in pareto_front]
-    diameters_m = [point.diameter for point in pareto_front]
-    fd_ratios = [point.f_d_ratio for point in pareto_front]
+    # Extract data from pareto_front in a single pass into one structured array
+    pareto_data = np.fromiter(
+        map(_PARETO_FIELDS, pareto_front),
+        dtype=_PARETO_DTYPE,
+        count=len(pareto_front),
+    )
+    gains_dbi = pareto_data["gain"]
+    fd_ratios = pareto_data["f_d_ratio"]
 
-    # Convert weights to grams for display
-    weights_g = [w * 1000 for w in weights_kg]
+    # Convert to display units (g, mm) with one vectorized multiply each
+    weights_g = pareto_data["weight"] * 1000.0
+    diameters_mm = pareto_data["diameter"] * 1000.0
 
     # Find the knee point in the pareto front
     # The knee point is the one that matches the optimal solution's diameter and f/D ratio
@@ -154,20 +277,15 @@ def create_pareto_front_plot(pareto_front: list, optimal_point: dict) -> go.Figu
     # Get the real weight from the knee point
     optimal_weight_g = knee_point.weight * 1000  # Convert kg to g
 
-    # Create hover text with detailed information
-    hover_texts = [
-        f"<b>Ganancia:</b> {gain:.2f} dBi<br>"
-        f"<b>Peso:</b> {weight:.1f} g<br>"
-        f"<b>Diámetro:</b> {diameter*1000:.1f} mm<br>"
-        f"<b>f/D:</b> {fd:.3f}"
-        for gain, weight, diameter, fd in zip(gains_dbi, weights_g, diameters_m, fd_ratios)
-    ]
+    # Hover details are formatted client-side by Plotly from customdata,
+    # only for the hovered point
+    hover_data = np.column_stack([gains_dbi, weights_g, diameters_mm, fd_ratios])
 
     fig = go.Figure()
 
-    # Add all Pareto solutions as scatter points
+    # Add all Pareto solutions as scatter points (WebGL: large fronts stay responsive)
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=weights_g,
             y=gains_dbi,
             mode="markers",
@@ -178,12 +296,19 @@ def create_pareto_front_plot(pareto_front: list, optimal_point: dict) -> go.Figu
                 "opacity": 0.6,
                 "line": {"width": 1, "color": "#4c51bf"},
             },
-            hovertext=hover_texts,
-            hovertemplate="%{hovertext}<extra></extra>",
+            customdata=hover_data,
+            hovertemplate=(
+                "<b>Ganancia:</b> %{customdata[0]:.2f} dBi<br>"
+                "<b>Peso:</b> %{customdata[1]:.1f} g<br>"
+                "<b>Diámetro:</b> %{customdata[2]:.1f} mm<br>"
+                "<b>f/D:</b> %{customdata[3]:.3f}"
+                "<extra></extra>"
+            ),
         )
     )
 
-    # Highlight the knee point (optimal solution)
+    # Highlight the knee point (optimal solution); a single SVG point keeps the
+    # "star" symbol and avoids a second WebGL context
     fig.add_trace(
         go.Scatter(
             x=[optimal_weight_g],
@@ -213,38 +338,30 @@ def create_pareto_front_plot(pareto_front: list, optimal_point: dict) -> go.Figu
             "text": "Frente de Pareto: Ganancia vs Peso",
             "x": 0.5,
             "xanchor": "center",
-            "font": {"size": 20, "color": "#e2e8f0"},
+            "font": {"size": 20},
         },
         xaxis={
             "title": "Peso de la Antena (g)",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
             "showgrid": True,
         },
         yaxis={
             "title": "Ganancia (dBi)",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
             "showgrid": True,
         },
-        plot_bgcolor="#1a1f2e",
-        paper_bgcolor="#1a1f2e",
-        font={"color": "#e2e8f0"},
+        template=SOGA_DARK_TEMPLATE,
         hovermode="closest",
+        spikedistance=0,
+        uirevision="fixed",
         showlegend=True,
-        legend={
-            "x": 0.02,
-            "y": 0.98,
-            "bgcolor": "rgba(26, 31, 46, 0.8)",
-            "bordercolor": "#667eea",
-            "borderwidth": 1,
-        },
+        legend=_DARK_LEGEND,
         height=600,
     )
 
     return fig
 
 
+# The configuration is a read-only singleton: hash it by identity
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs={AppConfig: id})
 def diagnose_infeasibility(user_parameters: dict, config) -> dict:
     """
     Diagnose why the optimization is infeasible and provide specific feedback.
@@ -275,28 +392,46 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
     max_fd = user_parameters["max_f_d_ratio"]
     range_km = user_parameters["desired_range_km"]
 
+    # --- DIAGNOSIS 0: Inverted ranges (no physics needed) ---
+    # Checked first so this path skips all the area/weight arithmetic below
+    if min_d >= max_d or min_fd >= max_fd:
+        diagnosis["main_issue"] = "invalid_ranges"
+        diagnosis["severity"] = "critical"
+        diagnosis["conflicts"].append(
+            {
+                "title": "❌ Rangos de Búsqueda Inválidos",
+                "description": (
+                    "Cada valor mínimo debe ser **menor** que su máximo para que el "
+                    "algoritmo tenga un espacio de búsqueda."
+                ),
+                "calculation": (
+                    f"Diámetro: {min_d:.3f} - {max_d:.3f} m\n"
+                    f"f/D: {min_fd:.2f} - {max_fd:.2f}"
+                ),
+                "type": "critical",
+            }
+        )
+        diagnosis["suggestions"].append(
+            "✅ Ajustar los rangos para que cada mínimo sea menor que su máximo"
+        )
+        return diagnosis
+
     # Get physical constants from config
     areal_density = config.simulation.reflector_areal_density_kg_per_m2  # kg/m²
     frequency_ghz = config.simulation.frequency_ghz
 
-    # Use numpy pi for precision
-    import numpy as np
-    pi = np.pi
+    # Weight (g) per squared meter of diameter for this reflector material
+    k_d2w = _K_D2W * areal_density
 
     # Calculate minimum possible weight with minimum diameter
-    min_area = pi * (min_d / 2) ** 2
-    min_weight_kg = min_area * areal_density
-    min_weight_g_calc = min_weight_kg * 1000
+    min_weight_g_calc = k_d2w * min_d * min_d
 
     # Calculate maximum possible weight with maximum diameter
-    max_area = pi * (max_d / 2) ** 2
-    max_weight_kg = max_area * areal_density
-    max_weight_g_calc = max_weight_kg * 1000
+    max_weight_g_calc = k_d2w * max_d * max_d
 
     # Calculate weight for mid-range diameter
     mid_d = (min_d + max_d) / 2
-    mid_area = pi * (mid_d / 2) ** 2
-    mid_weight_g = mid_area * areal_density * 1000
+    mid_weight_g = k_d2w * mid_d * mid_d
 
     # --- DIAGNOSIS 1: Weight constraint absolutely impossible ---
     # The lightest possible antenna (minimum diameter) is heavier than max allowed
@@ -305,66 +440,76 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
         diagnosis["severity"] = "critical"
 
         # Calculate what diameter would fit the weight constraint
-        feasible_d = 2 * np.sqrt(max_weight_g / 1000 / areal_density / pi)
+        feasible_d = math.sqrt(max_weight_g / k_d2w)
+
+        # Values repeated across the messages below, formatted once
+        min_d_txt = f"{min_d:.3f}"
+        max_weight_txt = f"{max_weight_g:.0f}"
+        min_weight_txt = f"{min_weight_g_calc:.1f}"
+        feasible_d_txt = f"{feasible_d:.3f}"
+        density_txt = f"{areal_density:.3f}"
 
         diagnosis["conflicts"].append(
             {
                 "title": "❌ Restricción de Peso Física­mente Imposible",
                 "description": (
-                    f"**Problema crítico**: Incluso la antena MÁS PEQUEÑA de tu rango ({min_d:.3f} m) "
-                    f"pesa aproximadamente **{min_weight_g_calc:.1f} g**, pero tu límite de peso es solo **{max_weight_g:.0f} g**.\n\n"
-                    f"Para que una antena pese {max_weight_g:.0f} g, su diámetro máximo sería **{feasible_d:.3f} m**, "
-                    f"que está **por debajo** de tu diámetro mínimo ({min_d:.3f} m)."
+                    f"**Problema crítico**: Incluso la antena MÁS PEQUEÑA de tu rango ({min_d_txt} m) "
+                    f"pesa aproximadamente **{min_weight_txt} g**, pero tu límite de peso es solo **{max_weight_txt} g**.\n\n"
+                    f"Para que una antena pese {max_weight_txt} g, su diámetro máximo sería **{feasible_d_txt} m**, "
+                    f"que está **por debajo** de tu diámetro mínimo ({min_d_txt} m)."
                 ),
                 "calculation": (
                     f"Peso_mínimo = π × (D_min/2)² × densidad_areal\n"
-                    f"           = π × ({min_d:.3f}/2)² × {areal_density:.3f} kg/m²\n"
-                    f"           = {min_weight_g_calc:.1f} g\n\n"
-                    f"Diámetro factible para {max_weight_g:.0f} g:\n"
-                    f"D_factible = 2 × √({max_weight_g:.0f}g ÷ 1000 ÷ {areal_density:.3f} ÷ π)\n"
-                    f"          = {feasible_d:.3f} m"
+                    f"           = π × ({min_d_txt}/2)² × {density_txt} kg/m²\n"
+                    f"           = {min_weight_txt} g\n\n"
+                    f"Diámetro factible para {max_weight_txt} g:\n"
+                    f"D_factible = 2 × √({max_weight_txt}g ÷ 1000 ÷ {density_txt} ÷ π)\n"
+                    f"          = {feasible_d_txt} m"
                 ),
                 "type": "critical",
             }
         )
 
         weight_increase_needed = int(min_weight_g_calc * 1.2)
-        diagnosis["suggestions"].append(
-            f"✅ **SOLUCIÓN 1**: Aumentar peso máximo a **{weight_increase_needed} g** (mínimo: {int(min_weight_g_calc)} g)"
-        )
-        diagnosis["suggestions"].append(
-            f"✅ **SOLUCIÓN 2**: Reducir diámetro mínimo a **{feasible_d:.3f} m** o menos"
-        )
-        diagnosis["suggestions"].append(
-            f"✅ **SOLUCIÓN 3**: Ajustar ambos: Diámetro 0.05-{max_d:.2f} m + Peso {int(mid_weight_g * 1.5)} g"
+        diagnosis["suggestions"].extend(
+            [
+                f"✅ **SOLUCIÓN 1**: Aumentar peso máximo a **{weight_increase_needed} g** (mínimo: {int(min_weight_g_calc)} g)",
+                f"✅ **SOLUCIÓN 2**: Reducir diámetro mínimo a **{feasible_d_txt} m** o menos",
+                f"✅ **SOLUCIÓN 3**: Ajustar ambos: Diámetro 0.05-{max_d:.2f} m + Peso {int(mid_weight_g * 1.5)} g",
+            ]
         )
         return diagnosis
 
     # --- DIAGNOSIS 2: Weight allows only small portion of diameter range ---
     # The weight constraint cuts off too much of the specified diameter range
-    feasible_max_d = 2 * np.sqrt(max_weight_g / 1000 / areal_density / pi)
+    feasible_max_d = math.sqrt(max_weight_g / k_d2w)
     usable_range_fraction = (feasible_max_d - min_d) / (max_d - min_d) if max_d > min_d else 0
 
     if feasible_max_d < max_d and usable_range_fraction < 0.3:
         diagnosis["main_issue"] = "weight_cuts_diameter_range"
         diagnosis["severity"] = "high"
 
+        min_d_txt = f"{min_d:.3f}"
+        max_d_txt = f"{max_d:.2f}"
+        max_weight_txt = f"{max_weight_g:.0f}"
+        feasible_max_d_txt = f"{feasible_max_d:.3f}"
+
         diagnosis["conflicts"].append(
             {
                 "title": "⚠️ Peso Máximo Incompatible con Rango de Diámetros",
                 "description": (
-                    f"Tu peso máximo ({max_weight_g:.0f} g) permite antenas de hasta **{feasible_max_d:.3f} m**, "
-                    f"pero tu rango de diámetros va hasta **{max_d:.2f} m**.\n\n"
+                    f"Tu peso máximo ({max_weight_txt} g) permite antenas de hasta **{feasible_max_d_txt} m**, "
+                    f"pero tu rango de diámetros va hasta **{max_d_txt} m**.\n\n"
                     f"Esto significa que **{(1-usable_range_fraction)*100:.0f}% de tu rango de diámetros** "
                     f"es inaccesible debido a la restricción de peso. El algoritmo tiene muy poco espacio "
-                    f"para optimizar (solo puede usar diámetros entre {min_d:.3f} m y {feasible_max_d:.3f} m)."
+                    f"para optimizar (solo puede usar diámetros entre {min_d_txt} m y {feasible_max_d_txt} m)."
                 ),
                 "calculation": (
-                    f"Diámetro máximo factible con {max_weight_g:.0f} g:\n"
-                    f"D_max_factible = 2 × √({max_weight_g:.0f}g ÷ 1000 ÷ {areal_density:.3f} ÷ π)\n"
-                    f"              = {feasible_max_d:.3f} m\n\n"
-                    f"Rango solicitado: {min_d:.3f} m - {max_d:.2f} m ({max_d - min_d:.3f} m)\n"
-                    f"Rango utilizable: {min_d:.3f} m - {feasible_max_d:.3f} m ({max(0, feasible_max_d - min_d):.3f} m)\n"
+                    f"Diámetro máximo factible con {max_weight_txt} g:\n"
+                    f"D_max_factible = 2 × √({max_weight_txt}g ÷ 1000 ÷ {areal_density:.3f} ÷ π)\n"
+                    f"              = {feasible_max_d_txt} m\n\n"
+                    f"Rango solicitado: {min_d_txt} m - {max_d_txt} m ({max_d - min_d:.3f} m)\n"
+                    f"Rango utilizable: {min_d_txt} m - {feasible_max_d_txt} m ({max(0, feasible_max_d - min_d):.3f} m)\n"
                     f"Porcentaje utilizable: {usable_range_fraction*100:.0f}%"
                 ),
                 "type": "high",
@@ -372,19 +517,18 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
         )
 
         needed_weight = int(max_weight_g_calc * 1.1)
-        diagnosis["suggestions"].append(
-            f"✅ **OPCIÓN A**: Reducir diámetro máximo a **{feasible_max_d:.2f} m** (factible con peso actual)"
-        )
-        diagnosis["suggestions"].append(
-            f"✅ **OPCIÓN B**: Aumentar peso máximo a **{needed_weight} g** (para usar rango completo)"
-        )
-        diagnosis["suggestions"].append(
-            f"✅ **OPCIÓN C** (balanceada): Diámetro hasta **{(feasible_max_d + max_d)/2:.2f} m** + Peso **{int((max_weight_g + needed_weight)/2)} g**"
+        diagnosis["suggestions"].extend(
+            [
+                f"✅ **OPCIÓN A**: Reducir diámetro máximo a **{feasible_max_d:.2f} m** (factible con peso actual)",
+                f"✅ **OPCIÓN B**: Aumentar peso máximo a **{needed_weight} g** (para usar rango completo)",
+                f"✅ **OPCIÓN C** (balanceada): Diámetro hasta **{(feasible_max_d + max_d)/2:.2f} m** + Peso **{int((max_weight_g + needed_weight)/2)} g**",
+            ]
         )
+        return diagnosis
 
     # --- DIAGNOSIS 3: f/D range too narrow for optimization ---
     fd_range = max_fd - min_fd
-    if fd_range < 0.15 and diagnosis["main_issue"] is None:
+    if fd_range < 0.15:
         diagnosis["main_issue"] = "fd_range_too_narrow"
         diagnosis["severity"] = "medium"
 
@@ -408,16 +552,17 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
 
         suggested_min_fd = max(0.25, min_fd - 0.15)
         suggested_max_fd = min(1.0, max_fd + 0.15)
-        diagnosis["suggestions"].append(
-            f"✅ Ampliar rango f/D a **{suggested_min_fd:.2f} - {suggested_max_fd:.2f}** (más flexible)"
-        )
-        diagnosis["suggestions"].append(
-            f"✅ O usar rango estándar: **0.35 - 0.70** (cubre geometrías típicas óptimas)"
+        diagnosis["suggestions"].extend(
+            [
+                f"✅ Ampliar rango f/D a **{suggested_min_fd:.2f} - {suggested_max_fd:.2f}** (más flexible)",
+                f"✅ O usar rango estándar: **0.35 - 0.70** (cubre geometrías típicas óptimas)",
+            ]
         )
+        return diagnosis
 
     # --- DIAGNOSIS 4: Diameter range too narrow ---
     d_range = max_d - min_d
-    if d_range < 0.2 and diagnosis["main_issue"] is None:
+    if d_range < 0.2:
         diagnosis["main_issue"] = "diameter_range_too_narrow"
         diagnosis["severity"] = "medium"
 
@@ -440,9 +585,10 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
 
         # Check if we can expand without violating weight
         suggested_max_d = min(3.0, min_d + 0.8)
-        suggested_weight = int(pi * (suggested_max_d/2)**2 * areal_density * 1000 * 1.2)
+        suggested_weight = int(k_d2w * suggested_max_d * suggested_max_d * 1.2)
 
-        if suggested_max_d * 1000 * areal_density * pi / 4 <= max_weight_g / 1000:
+        # Same test as D·1000·ρ·π/4 ≤ W/1000, folded into k_d2w = ρ·π/4·1000
+        if k_d2w * suggested_max_d * 1000.0 <= max_weight_g:
             diagnosis["suggestions"].append(
                 f"✅ Ampliar diámetro máximo a **{suggested_max_d:.2f} m** (compatible con tu peso actual)"
             )
@@ -450,6 +596,7 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
             diagnosis["suggestions"].append(
                 f"✅ Ampliar diámetro a **{max(0.1, min_d*0.7):.2f} m - {min(3.0, max_d*1.8):.2f} m** + aumentar peso a **{suggested_weight} g**"
             )
+        return diagnosis
 
     # --- DIAGNOSIS 5: Range requirement vs antenna size mismatch ---
     # Estimate required gain for the desired range using simplified link budget
@@ -466,116 +613,163 @@ def diagnose_infeasibility(user_parameters: dict, config) -> dict:
         # Simplified: D_needed ≈ 10^((gain_needed - 7)/20) / f_GHz
         d_needed_for_range = 10**((approx_gain_needed - 7) / 20) / frequency_ghz
 
-        if d_needed_for_range > max_d * 1.5 and diagnosis["main_issue"] is None:
+        if d_needed_for_range > max_d * 1.5:
             diagnosis["main_issue"] = "range_requires_larger_antenna"
             diagnosis["severity"] = "high"
 
             # What range is achievable with current max diameter?
-            max_gain_achievable = 20 * np.log10(max_d * frequency_ghz * 3.54) + 7
+            max_gain_achievable = 20 * math.log10(max_d * frequency_ghz * 3.54) + 7
             achievable_range = (max_gain_achievable - 20) / 2
 
+            range_txt = f"{range_km:.1f}"
+            max_d_txt = f"{max_d:.2f}"
+            achievable_range_txt = f"{achievable_range:.1f}"
+            d_needed_txt = f"{d_needed_for_range:.2f}"
+
             diagnosis["conflicts"].append(
                 {
                     "title": "⚠️ Alcance Incompatible con Tamaño de Antena",
                     "description": (
-                        f"Tu alcance deseado es **{range_km:.1f} km**, lo que requiere alta ganancia.\n\n"
-                        f"Con tu diámetro máximo actual ({max_d:.2f} m), el alcance máximo estimado es "
-                        f"aproximadamente **{achievable_range:.1f} km** en condiciones ideales.\n\n"
-                        f"Para alcanzar {range_km:.1f} km confiablemente, necesitarías una antena de al menos "
-                        f"**{d_needed_for_range:.2f} m** de diámetro."
+                        f"Tu alcance deseado es **{range_txt} km**, lo que requiere alta ganancia.\n\n"
+                        f"Con tu diámetro máximo actual ({max_d_txt} m), el alcance máximo estimado es "
+                        f"aproximadamente **{achievable_range_txt} km** en condiciones ideales.\n\n"
+                        f"Para alcanzar {range_txt} km confiablemente, necesitarías una antena de al menos "
+                        f"**{d_needed_txt} m** de diámetro."
                     ),
                     "calculation": (
-                        f"Estimación de alcance con D={max_d:.2f}m:\n"
+                        f"Estimación de alcance con D={max_d_txt}m:\n"
                         f"Ganancia máxima ≈ {max_gain_achievable:.1f} dBi\n"
-                        f"Alcance estimado ≈ {achievable_range:.1f} km\n\n"
-                        f"Para {range_km:.1f} km:\n"
+                        f"Alcance estimado ≈ {achievable_range_txt} km\n\n"
+                        f"Para {range_txt} km:\n"
                         f"Ganancia requerida ≈ {approx_gain_needed:.1f} dBi\n"
-                        f"Diámetro necesario ≈ {d_needed_for_range:.2f} m"
+                        f"Diámetro necesario ≈ {d_needed_txt} m"
                     ),
                     "type": "high",
                 }
             )
 
-            diagnosis["suggestions"].append(
-                f"✅ **OPCIÓN 1**: Reducir alcance objetivo a **{achievable_range:.1f} km** (factible con D={max_d:.2f}m)"
-            )
-            diagnosis["suggestions"].append(
-                f"✅ **OPCIÓN 2**: Aumentar diámetro máximo a **{d_needed_for_range:.1f} m** o más"
-            )
-            diagnosis["suggestions"].append(
-                f"✅ **OPCIÓN 3**: Balance intermedio: Alcance **{(range_km + achievable_range)/2:.1f} km** + Diámetro hasta **{(max_d + d_needed_for_range)/2:.1f} m**"
+            diagnosis["suggestions"].extend(
+                [
+                    f"✅ **OPCIÓN 1**: Reducir alcance objetivo a **{achievable_range_txt} km** (factible con D={max_d_txt}m)",
+                    f"✅ **OPCIÓN 2**: Aumentar diámetro máximo a **{d_needed_for_range:.1f} m** o más",
+                    f"✅ **OPCIÓN 3**: Balance intermedio: Alcance **{(range_km + achievable_range)/2:.1f} km** + Diámetro hasta **{(max_d + d_needed_for_range)/2:.1f} m**",
+                ]
             )
+            return diagnosis
 
     # --- DIAGNOSIS 6: General over-constrained problem ---
     # Multiple moderate issues combine to make problem infeasible
-    if diagnosis["main_issue"] is None:
-        diagnosis["main_issue"] = "general_over_constrained"
-        diagnosis["severity"] = "medium"
-
-        # Calculate "constraint tightness" metrics
-        weight_tightness = max_weight_g / max_weight_g_calc  # closer to 0 = tighter
-        d_range_adequacy = d_range / 1.0  # compared to 1m ideal range
-        fd_range_adequacy = fd_range / 0.4  # compared to 0.4 ideal range
-
-        diagnosis["conflicts"].append(
-            {
-                "title": "⚠️ Espacio de Búsqueda Sobre-Restringido",
-                "description": (
-                    f"Tus restricciones son individualmente válidas, pero en conjunto crean un espacio "
-                    f"de búsqueda muy limitado para el algoritmo genético NSGA-II.\n\n"
-                    f"**Análisis de restricciones**:\n"
-                    f"- Peso: {max_weight_g:.0f}g (holgura: {weight_tightness*100:.0f}% del máximo posible)\n"
-                    f"- Rango de diámetro: {d_range:.3f}m (adecuación: {d_range_adequacy*100:.0f}% de lo ideal)\n"
-                    f"- Rango f/D: {fd_range:.2f} (adecuación: {fd_range_adequacy*100:.0f}% de lo ideal)\n\n"
-                    f"El algoritmo necesita más libertad en al menos 2 de estas dimensiones para encontrar "
-                    f"soluciones óptimas en el frente de Pareto."
-                ),
-                "calculation": (
-                    f"Configuración actual:\n"
-                    f"  • Diámetro: {min_d:.3f} - {max_d:.2f} m\n"
-                    f"  • Peso: ≤ {max_weight_g:.0f} g\n"
-                    f"  • f/D: {min_fd:.2f} - {max_fd:.2f}\n"
-                    f"  • Alcance: {range_km:.1f} km\n\n"
-                    f"Métricas de restricción:\n"
-                    f"  • Holgura de peso: {weight_tightness*100:.0f}%\n"
-                    f"  • Flexibilidad diámetro: {d_range_adequacy*100:.0f}%\n"
-                    f"  • Flexibilidad f/D: {fd_range_adequacy*100:.0f}%"
-                ),
-                "type": "medium",
-            }
-        )
-
-        # Provide a relaxed configuration
-        relaxed_max_d = min(3.0, max_d * 1.4)
-        relaxed_weight = int(pi * (relaxed_max_d/2)**2 * areal_density * 1000 * 1.2)
-        relaxed_min_fd = max(0.25, min_fd - 0.1)
-        relaxed_max_fd = min(1.0, max_fd + 0.1)
+    diagnosis["main_issue"] = "general_over_constrained"
+    diagnosis["severity"] = "medium"
+
+    # Calculate "constraint tightness" metrics
+    weight_tightness = max_weight_g / max_weight_g_calc  # closer to 0 = tighter
+    d_range_adequacy = d_range / 1.0  # compared to 1m ideal range
+    fd_range_adequacy = fd_range / 0.4  # compared to 0.4 ideal range
+
+    max_weight_txt = f"{max_weight_g:.0f}"
+    range_txt = f"{range_km:.1f}"
+    weight_tightness_txt = f"{weight_tightness*100:.0f}"
+    d_range_adequacy_txt = f"{d_range_adequacy*100:.0f}"
+    fd_range_adequacy_txt = f"{fd_range_adequacy*100:.0f}"
+
+    diagnosis["conflicts"].append(
+        {
+            "title": "⚠️ Espacio de Búsqueda Sobre-Restringido",
+            "description": (
+                f"Tus restricciones son individualmente válidas, pero en conjunto crean un espacio "
+                f"de búsqueda muy limitado para el algoritmo genético NSGA-II.\n\n"
+                f"**Análisis de restricciones**:\n"
+                f"- Peso: {max_weight_txt}g (holgura: {weight_tightness_txt}% del máximo posible)\n"
+                f"- Rango de diámetro: {d_range:.3f}m (adecuación: {d_range_adequacy_txt}% de lo ideal)\n"
+                f"- Rango f/D: {fd_range:.2f} (adecuación: {fd_range_adequacy_txt}% de lo ideal)\n\n"
+                f"El algoritmo necesita más libertad en al menos 2 de estas dimensiones para encontrar "
+                f"soluciones óptimas en el frente de Pareto."
+            ),
+            "calculation": (
+                f"Configuración actual:\n"
+                f"  • Diámetro: {min_d:.3f} - {max_d:.2f} m\n"
+                f"  • Peso: ≤ {max_weight_txt} g\n"
+                f"  • f/D: {min_fd:.2f} - {max_fd:.2f}\n"
+                f"  • Alcance: {range_txt} km\n\n"
+                f"Métricas de restricción:\n"
+                f"  • Holgura de peso: {weight_tightness_txt}%\n"
+                f"  • Flexibilidad diámetro: {d_range_adequacy_txt}%\n"
+                f"  • Flexibilidad f/D: {fd_range_adequacy_txt}%"
+            ),
+            "type": "medium",
+        }
+    )
 
-        diagnosis["suggestions"].append(
-            "✅ **SOLUCIÓN**: Relajar múltiples restricciones simultáneamente para dar espacio al algoritmo:"
-        )
-        diagnosis["suggestions"].append(
-            f"   • Diámetro: **{min_d:.2f} - {relaxed_max_d:.2f} m** (más rango)"
-        )
-        diagnosis["suggestions"].append(
-            f"   • Peso: **{relaxed_weight} g** (más holgura)"
-        )
-        diagnosis["suggestions"].append(
-            f"   • f/D: **{relaxed_min_fd:.2f} - {relaxed_max_fd:.2f}** (más flexibilidad geométrica)"
-        )
-        diagnosis["suggestions"].append(
-            f"   • Alcance: **{range_km * 0.8:.1f} km** (más realista) o mantener {range_km:.1f} km si aumentas el diámetro"
-        )
+    # Provide a relaxed configuration
+    relaxed_max_d = min(3.0, max_d * 1.4)
+    relaxed_weight = int(k_d2w * relaxed_max_d * relaxed_max_d * 1.2)
+    relaxed_min_fd = max(0.25, min_fd - 0.1)
+    relaxed_max_fd = min(1.0, max_fd + 0.1)
+
+    diagnosis["suggestions"].extend(
+        [
+            "✅ **SOLUCIÓN**: Relajar múltiples restricciones simultáneamente para dar espacio al algoritmo:",
+            f"   • Diámetro: **{min_d:.2f} - {relaxed_max_d:.2f} m** (más rango)",
+            f"   • Peso: **{relaxed_weight} g** (más holgura)",
+            f"   • f/D: **{relaxed_min_fd:.2f} - {relaxed_max_fd:.2f}** (más flexibilidad geométrica)",
+            f"   • Alcance: **{range_km * 0.8:.1f} km** (más realista) o mantener {range_txt} km si aumentas el diámetro",
+        ]
+    )
 
     return diagnosis
 
 
+# Static layout of the parabola cross-section; only shapes and annotations
+# depend on the design and are added per call
+_PARABOLA_LAYOUT = {
+    "title": {
+        "text": "Geometría de la Antena Parabólica (Vista en Corte)",
+        "x": 0.5,
+        "xanchor": "center",
+        "font": {"size": 18},
+    },
+    "xaxis": {
+        "title": "Distancia Radial (mm)",
+        "zeroline": True,
+        "zerolinecolor": "#4a5568",
+        "zerolinewidth": 2,
+    },
+    "yaxis": {
+        "title": "Profundidad Axial (mm)",
+        "zeroline": True,
+        "zerolinecolor": "#4a5568",
+        "zerolinewidth": 2,
+        "scaleanchor": "x",  # Equal aspect ratio for accurate representation
+        "scaleratio": 1,
+    },
+    "template": SOGA_DARK_TEMPLATE,
+    "hovermode": "closest",
+    "uirevision": "fixed",
+    "showlegend": True,
+    "legend": _DARK_LEGEND,
+    "height": 500,
+}
+
+# Unit parabola abscissa in [-1, 1]; 101 points (odd, so the vertex is
+# sampled) is plenty for a 500 px chart
+_PARABOLA_X_UNIT = np.linspace(-1.0, 1.0, 101)
+_PARABOLA_X_UNIT_SQ = _PARABOLA_X_UNIT * _PARABOLA_X_UNIT
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
 def create_parabola_geometry_plot(
     diameter_mm: float, focal_length_mm: float, depth_mm: float
 ) -> go.Figure:
     """
     Create an interactive 2D plot showing the parabolic antenna geometry.
 
+    Cached on the three dimensions, so reruns that leave the selected design
+    unchanged reuse the figure instead of rebuilding it. On a cache miss the
+    whole figure spec is assembled as plain dicts and validated once by
+    ``go.Figure``, which is several times cheaper than adding each trace,
+    shape and annotation incrementally.
+
     Args:
         diameter_mm: Antenna diameter in millimeters
         focal_length_mm: Focal length in millimeters
@@ -584,302 +778,525 @@ def create_parabola_geometry_plot(
     Returns:
         Plotly Figure object with parabola cross-section
     """
-    import numpy as np
-
-    # Convert to meters for calculation
-    diameter_m = diameter_mm / 1000.0
-    focal_length_m = focal_length_mm / 1000.0
-    depth_m = depth_mm / 1000.0
+    # Parabola equation: z = x^2 / (4*f), evaluated directly in mm.
+    # float32 halves the serialized payload with no visible precision loss
+    radius_mm = diameter_mm / 2.0
+    x_mm = _PARABOLA_X_UNIT * radius_mm
+    z_mm = _PARABOLA_X_UNIT_SQ * (radius_mm * radius_mm / (4.0 * focal_length_mm))
+
+    traces = [
+        # Parabola surface
+        {
+            "type": "scatter",
+            "x": x_mm.astype(np.float32),
+            "y": z_mm.astype(np.float32),
+            "mode": "lines",
+            "name": "Superficie Parabólica",
+            "line": {"color": "#667eea", "width": 4},
+            "fill": "tozeroy",
+            "fillcolor": "rgba(102, 126, 234, 0.2)",
+            "hovertemplate": "x: %{x:.1f} mm<br>z: %{y:.1f} mm<extra></extra>",
+        },
+        # Aperture line (diameter)
+        {
+            "type": "scatter",
+            "x": [-radius_mm, radius_mm],
+            "y": [0, 0],
+            "mode": "lines",
+            "name": "Apertura",
+            "line": {"color": "#48bb78", "width": 3, "dash": "dash"},
+            "hoverinfo": "skip",
+        },
+        # Focal point
+        {
+            "type": "scatter",
+            "x": [0],
+            "y": [focal_length_mm],
+            "mode": "markers+text",
+            "name": "Punto Focal",
+            "marker": {"color": "#f56565", "size": 12, "symbol": "star"},
+            "text": ["F"],
+            "textposition": "top center",
+            "textfont": {"size": 14, "color": "#f56565"},
+            "hovertemplate": "Punto Focal<br>z: %{y:.1f} mm<extra></extra>",
+        },
+        # Depth indicator line
+        {
+            "type": "scatter",
+            "x": [0, 0],
+            "y": [0, depth_mm],
+            "mode": "lines",
+            "name": "Profundidad",
+            "line": {"color": "#ed8936", "width": 2, "dash": "dot"},
+            "hoverinfo": "skip",
+        },
+    ]
 
-    # Calculate parabola points
-    # Parabola equation: z = x^2 / (4*f)
-    # where f is the focal length
-    radius_m = diameter_m / 2.0
-    x_points = np.linspace(-radius_m, radius_m, 200)
-    z_points = (x_points**2) / (4.0 * focal_length_m)
+    # Diameter indicator
+    shapes = [
+        {
+            "type": "line",
+            "x0": -radius_mm,
+            "y0": -depth_mm * 0.1,
+            "x1": radius_mm,
+            "y1": -depth_mm * 0.1,
+            "line": {"color": "#48bb78", "width": 2},
+        }
+    ]
 
-    # Create figure
-    fig = go.Figure()
+    # Dimension annotations
+    annotations = [
+        {
+            "x": 0,
+            "y": -depth_mm * 0.2,
+            "text": f"D = {diameter_mm:.1f} mm",
+            "showarrow": False,
+            "font": {"size": 12, "color": "#48bb78"},
+            "bgcolor": "rgba(26, 31, 46, 0.8)",
+            "bordercolor": "#48bb78",
+            "borderwidth": 1,
+        },
+        {
+            "x": radius_mm * 1.15,
+            "y": depth_mm / 2,
+            "text": f"h = {depth_mm:.1f} mm",
+            "showarrow": True,
+            "arrowhead": 2,
+            "arrowsize": 1,
+            "arrowwidth": 2,
+            "arrowcolor": "#ed8936",
+            "ax": 60,  # Increased from 40 to move annotation box further right
+            "ay": 0,
+            "font": {"size": 12, "color": "#ed8936"},
+            "bgcolor": "rgba(26, 31, 46, 0.8)",
+            "bordercolor": "#ed8936",
+            "borderwidth": 1,
+        },
+        {
+            "x": -radius_mm * 0.2,
+            "y": focal_length_mm * 1.1,
+            "text": f"f = {focal_length_mm:.1f} mm",
+            "showarrow": True,
+            "arrowhead": 2,
+            "arrowsize": 1,
+            "arrowwidth": 2,
+            "arrowcolor": "#f56565",
+            "ax": -30,
+            "ay": -30,
+            "font": {"size": 12, "color": "#f56565"},
+            "bgcolor": "rgba(26, 31, 46, 0.8)",
+            "bordercolor": "#f56565",
+            "borderwidth": 1,
+        },
+    ]
 
-    # Plot parabola surface
-    fig.add_trace(
-        go.Scatter(
-            x=x_points * 1000,  # Convert to mm
-            y=z_points * 1000,  # Convert to mm
-            mode="lines",
-            name="Superficie Parabólica",
-            line={"color": "#667eea", "width": 4},
-            fill="tozeroy",
-            fillcolor="rgba(102, 126, 234, 0.2)",
-            hovertemplate="x: %{x:.1f} mm<br>z: %{y:.1f} mm<extra></extra>",
-        )
+    return go.Figure(
+        data=traces,
+        layout={**_PARABOLA_LAYOUT, "shapes": shapes, "annotations": annotations},
     )
 
-    # Add aperture line (diameter)
-    fig.add_trace(
-        go.Scatter(
-            x=[-radius_m * 1000, radius_m * 1000],
-            y=[0, 0],
-            mode="lines",
-            name="Apertura",
-            line={"color": "#48bb78", "width": 3, "dash": "dash"},
-            hoverinfo="skip",
-        )
-    )
 
-    # Add focal point
-    fig.add_trace(
-        go.Scatter(
-            x=[0],
-            y=[focal_length_m * 1000],
-            mode="markers+text",
-            name="Punto Focal",
-            marker={"color": "#f56565", "size": 12, "symbol": "star"},
-            text=["F"],
-            textposition="top center",
-            textfont={"size": 14, "color": "#f56565"},
-            hovertemplate="Punto Focal<br>z: %{y:.1f} mm<extra></extra>",
-        )
-    )
+def result_figure(name: str, build: Callable[..., go.Figure], *args) -> go.Figure:
+    """
+    Return figure ``name`` for the result in session state, building it once.
 
-    # Add depth indicator line
-    fig.add_trace(
-        go.Scatter(
-            x=[0, 0],
-            y=[0, depth_m * 1000],
-            mode="lines",
-            name="Profundidad",
-            line={"color": "#ed8936", "width": 2, "dash": "dot"},
-            hoverinfo="skip",
-        )
-    )
+    Figures live in session state next to the result they were drawn from and
+    are dropped when ``result_id`` changes, so switching tabs or editing a
+    widget reuses them without re-hashing the inputs or unpickling a copy
+    from ``st.cache_data``.
 
-    # Add diameter indicator
-    fig.add_shape(
-        type="line",
-        x0=-radius_m * 1000,
-        y0=-depth_m * 1000 * 0.1,
-        x1=radius_m * 1000,
-        y1=-depth_m * 1000 * 0.1,
-        line={"color": "#48bb78", "width": 2},
-    )
+    Args:
+        name: Key of the figure within the current result
+        build: Function that creates the figure from ``args``
+        *args: Arguments forwarded to ``build`` on first use
 
-    # Add dimension annotations
-    fig.add_annotation(
-        x=0,
-        y=-depth_m * 1000 * 0.2,
-        text=f"D = {diameter_mm:.1f} mm",
-        showarrow=False,
-        font={"size": 12, "color": "#48bb78"},
-        bgcolor="rgba(26, 31, 46, 0.8)",
-        bordercolor="#48bb78",
-        borderwidth=1,
-    )
+    Returns:
+        Plotly Figure object
+    """
+    figures = st.session_state.get("result_figures")
+    if figures is None or figures["result_id"] != st.session_state.result_id:
+        figures = st.session_state.result_figures = {
+            "result_id": st.session_state.result_id
+        }
+    if name not in figures:
+        figures[name] = build(*args)
+    return figures[name]
 
-    fig.add_annotation(
-        x=radius_m * 1000 * 1.15,
-        y=depth_m * 1000 / 2,
-        text=f"h = {depth_mm:.1f} mm",
-        showarrow=True,
-        arrowhead=2,
-        arrowsize=1,
-        arrowwidth=2,
-        arrowcolor="#ed8936",
-        ax=60,  # Increased from 40 to move annotation box further right
-        ay=0,
-        font={"size": 12, "color": "#ed8936"},
-        bgcolor="rgba(26, 31, 46, 0.8)",
-        bordercolor="#ed8936",
-        borderwidth=1,
-    )
 
-    fig.add_annotation(
-        x=-radius_m * 1000 * 0.2,
-        y=focal_length_m * 1000 * 1.1,
-        text=f"f = {focal_length_mm:.1f} mm",
-        showarrow=True,
-        arrowhead=2,
-        arrowsize=1,
-        arrowwidth=2,
-        arrowcolor="#f56565",
-        ax=-30,
-        ay=-30,
-        font={"size": 12, "color": "#f56565"},
-        bgcolor="rgba(26, 31, 46, 0.8)",
-        bordercolor="#f56565",
-        borderwidth=1,
-    )
+def export_convergence_to_bytes(convergence_history: list[float]) -> bytes:
+    """
+    Export convergence history to CSV format in memory.
 
-    # Update layout
-    fig.update_layout(
-        title={
-            "text": "Geometría de la Antena Parabólica (Vista en Corte)",
-            "x": 0.5,
-            "xanchor": "center",
-            "font": {"size": 18, "color": "#e2e8f0"},
-        },
-        xaxis={
-            "title": "Distancia Radial (mm)",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
-            "zeroline": True,
-            "zerolinecolor": "#4a5568",
-            "zerolinewidth": 2,
-        },
-        yaxis={
-            "title": "Profundidad Axial (mm)",
-            "gridcolor": "#2d3748",
-            "color": "#e2e8f0",
-            "zeroline": True,
-            "zerolinecolor": "#4a5568",
-            "zerolinewidth": 2,
-            "scaleanchor": "x",  # Equal aspect ratio for accurate representation
-            "scaleratio": 1,
-        },
-        plot_bgcolor="#1a1f2e",
-        paper_bgcolor="#1a1f2e",
-        font={"color": "#e2e8f0"},
-        hovermode="closest",
-        showlegend=True,
-        legend={
-            "x": 0.02,
-            "y": 0.98,
-            "bgcolor": "rgba(26, 31, 46, 0.8)",
-            "bordercolor": "#667eea",
-            "borderwidth": 1,
-        },
-        height=500,
-    )
+    Args:
+        convergence_history: List of best gain values per generation
 
-    return fig
+    Returns:
+        CSV data as bytes
+    """
+    buffer = io.StringIO()
+    ResultsExporter.export_convergence_to_csv(convergence_history, buffer)
+    return buffer.getvalue().encode("utf-8")
 
 
-def export_convergence_to_bytes(convergence_history: list[float]) -> bytes:
+def export_convergence_to_arrow(convergence_history: list[float], fmt: str) -> bytes:
     """
-    Export convergence history to CSV format in memory.
+    Export convergence history to a columnar file in memory.
+
+    Uses the same columns as the CSV export (generation, best_gain_dbi).
 
     Args:
         convergence_history: List of best gain values per generation
+        fmt: "parquet" (zstd-compressed) or "feather" (lz4-compressed)
 
     Returns:
-        CSV data as bytes
+        File contents as bytes
+    """
+    # pyarrow is imported on first export only: Streamlit does not load it,
+    # and most sessions never download a columnar file
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    gains = np.asarray(convergence_history, dtype=np.float64)
+    table = pa.table(
+        {"generation": np.arange(gains.size), "best_gain_dbi": gains}
+    )
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        feather.write_feather(table, sink, compression="lz4")
+    return sink.getvalue().to_pybytes()
+
+
+def export_pareto_to_zip(pareto_front: list, shard_rows: int = 10_000) -> bytes:
     """
+    Export the Pareto front as zstd Parquet shards packed in a ZIP archive.
+
+    Each shard holds at most ``shard_rows`` points, so large fronts can be
+    read back piecewise (e.g. with ``pyarrow.dataset``). Members are stored
+    uncompressed since Parquet pages are already compressed.
+
+    Args:
+        pareto_front: List of ParetoPoint objects from optimization
+        shard_rows: Maximum number of points per Parquet file
+
+    Returns:
+        ZIP archive as bytes
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pareto_data = np.fromiter(
+        map(_PARETO_FIELDS, pareto_front),
+        dtype=_PARETO_DTYPE,
+        count=len(pareto_front),
+    )
     buffer = io.BytesIO()
-    temp_path = Path("temp_convergence.csv")
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for shard, start in enumerate(range(0, pareto_data.size, shard_rows)):
+            chunk = pareto_data[start : start + shard_rows]
+            table = pa.table({name: chunk[name] for name in _PARETO_DTYPE.names})
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink, compression="zstd")
+            archive.writestr(
+                f"pareto_{shard:04d}.parquet", sink.getvalue().to_pybytes()
+            )
+    return buffer.getvalue()
 
-    try:
-        # Write to temporary file
-        ResultsExporter.export_convergence_to_csv(convergence_history, temp_path)
 
-        # Read back as bytes
-        with open(temp_path, "rb") as f:
-            csv_data = f.read()
+# Convergence download formats: label -> (extension, MIME type, arrow format)
+_CONVERGENCE_FORMATS = {
+    "CSV": ("csv", "text/csv", None),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", "parquet"),
+    "Feather": ("feather", "application/vnd.apache.arrow.file", "feather"),
+}
 
-        return csv_data
-    finally:
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def serialize_session(result_id: str, params: dict, _result: dict) -> bytes:
+    """
+    Serialize a session (parameters + results) to JSON bytes.
 
-def validate_user_inputs(user_parameters: dict, config) -> tuple[bool, list[str], list[str]]:
+    Args:
+        result_id: Identifier of the optimization run; keys the cache in
+            place of the unhashed ``_result``
+        params: User parameters of the session
+        _result: Optimization result dictionary; its Pareto front may hold
+            ParetoPoint objects or already-serialized data
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    # Store the Pareto front column-wise: one list per ParetoPoint field,
+    # filled from a single structured array instead of one dict per point.
+    # The result is only copied when there is a front to replace; fronts
+    # that are already plain data (e.g. from a loaded session) pass through.
+    results = _result
+    pareto_front = _result.get("pareto_front")
+    if isinstance(pareto_front, list) and pareto_front and hasattr(
+        pareto_front[0], "diameter"
+    ):
+        pareto_data = np.fromiter(
+            map(_PARETO_FIELDS, pareto_front),
+            dtype=_PARETO_DTYPE,
+            count=len(pareto_front),
+        )
+        results = {
+            **_result,
+            "pareto_front": {
+                "diameter": pareto_data["diameter"].tolist(),
+                "f_d_ratio": pareto_data["f_d_ratio"].tolist(),
+                "gain": pareto_data["gain"].tolist(),
+                "weight": pareto_data["weight"].tolist(),
+            },
+        }
+
+    session_data = {
+        "params": params,
+        "results": results,
+    }
+
+    # UTF-8 bytes straight from the exporter (orjson when installed)
+    return ResultsExporter.export_to_json_bytes(session_data)
+
+
+def serialize_session_gz(result_id: str, params: dict, _result: dict) -> bytes:
+    """
+    Gzip-compressed variant of serialize_session for the .json.gz download.
+
+    Reuses the cached JSON bytes; mtime=0 keeps the output deterministic.
+    """
+    return gzip.compress(serialize_session(result_id, params, _result), mtime=0)
+
+
+@functools.lru_cache(maxsize=32)
+def performance_rows(
+    gain_dbi: float,
+    beamwidth_deg: float,
+    frequency_ghz: float,
+    aperture_efficiency: float,
+) -> dict[str, tuple[str, ...]]:
+    """
+    Formatted rows of the RF performance table, built once per result.
+
+    Returns:
+        Column mapping for st.table; values are tuples so the cached
+        object cannot be mutated by callers
+    """
+    return {
+        "Métrica": (
+            "Ganancia Directiva",
+            "Ancho de Haz (HPBW)",
+            "Frecuencia de Operación",
+            "Eficiencia de Apertura",
+        ),
+        "Valor": (
+            f"{gain_dbi:.2f} dBi",
+            f"{beamwidth_deg:.2f}°",
+            f"{frequency_ghz:.1f} GHz",
+            f"{aperture_efficiency * 100:.0f}%",
+        ),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _geometry_limits(
+    min_d: float, max_d: float, max_weight_g: float, areal_density: float
+) -> tuple[float, float, float]:
+    """
+    Weight/diameter limits shared by the sidebar checks and input validation.
+
+    Returns:
+        Tuple (min_possible_weight_g, max_possible_weight_g, feasible_max_d):
+        reflector weight at the minimum and maximum diameters, and the largest
+        diameter whose weight fits in max_weight_g
+    """
+    k_d2w = _K_D2W * areal_density
+    min_possible_weight_g = k_d2w * min_d * min_d
+    max_possible_weight_g = k_d2w * max_d * max_d
+    feasible_max_d = math.sqrt(max_weight_g / k_d2w)
+    return min_possible_weight_g, max_possible_weight_g, feasible_max_d
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def sidebar_feedback(
+    diameter_range: tuple[float, float],
+    fd_range: tuple[float, float],
+    max_payload: float,
+    desired_range: float,
+    areal_density: float,
+    frequency_ghz: float,
+) -> tuple[str | None, str | None, str | None, str | None]:
+    """
+    Build the quick-validation captions shown under the sidebar sliders.
+
+    Args:
+        diameter_range: (min, max) diameter in meters
+        fd_range: (min, max) f/D ratio
+        max_payload: Maximum antenna weight in grams
+        desired_range: Desired communication range in km
+        areal_density: Reflector areal density in kg/m²
+        frequency_ghz: Operating frequency in GHz
+
+    Returns:
+        Captions for the diameter, f/D, weight and range sliders
+        (None where there is nothing to show)
+    """
+    min_d, max_d = diameter_range
+
+    # Diameter range width
+    d_range = max_d - min_d
+    if d_range < 0.1:
+        diameter_hint = "⚠️ Rango muy estrecho. Recomendado: ≥ 0.5 m"
+    elif d_range >= 0.5:
+        diameter_hint = "✅ Rango adecuado para optimización"
+    else:
+        diameter_hint = None
+
+    # f/D range width
+    fd_range_width = fd_range[1] - fd_range[0]
+    if fd_range_width < 0.15:
+        fd_hint = "⚠️ Rango muy limitado. Recomendado: ≥ 0.30"
+    elif fd_range_width >= 0.30:
+        fd_hint = "✅ Rango adecuado para exploración"
+    else:
+        fd_hint = None
+
+    # Weight vs diameter compatibility
+    min_possible_weight_g, _, feasible_max_d = _geometry_limits(
+        min_d, max_d, max_payload, areal_density
+    )
+    if min_possible_weight_g > max_payload:
+        weight_hint = f"❌ Peso muy bajo: mínimo necesario ~{int(min_possible_weight_g)} g"
+    elif feasible_max_d < max_d:
+        weight_hint = f"⚠️ Peso limita diámetro a ~{feasible_max_d:.2f} m"
+    else:
+        weight_hint = "✅ Peso compatible con rango de diámetros"
+
+    # Range realism for the antenna size
+    range_hint = None
+    if desired_range > 15:
+        approx_gain_needed = 20 + 2 * desired_range
+        d_needed = 10**((approx_gain_needed - 7) / 20) / frequency_ghz
+        if d_needed > max_d * 1.3:
+            range_hint = f"⚠️ Alcance ambicioso: se recomienda D ≥ {d_needed:.2f} m"
+
+    return diameter_hint, fd_hint, weight_hint, range_hint
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def validate_user_inputs(
+    min_d: float,
+    max_d: float,
+    max_weight_g: float,
+    min_fd: float,
+    max_fd: float,
+    range_km: float,
+    areal_density: float,
+    frequency_ghz: float,
+    lim_min_d: float,
+    lim_max_d: float,
+) -> tuple[bool, tuple[str, ...], tuple[str, ...]]:
     """
     Valida los parámetros del usuario antes de ejecutar la optimización.
 
     Realiza validaciones de sentido común, consistencia física, y detecta
-    problemas obvios que harían que la optimización falle.
+    problemas obvios que harían que la optimización falle. Recibe sólo
+    escalares para que Streamlit pueda memorizar el resultado: reenviar los
+    mismos parámetros no repite el trabajo.
 
     Args:
-        user_parameters: Parámetros proporcionados por el usuario
-        config: Configuración de la aplicación
+        min_d, max_d: Rango de diámetros del usuario (m)
+        max_weight_g: Peso máximo permitido (g)
+        min_fd, max_fd: Rango de relación f/D del usuario
+        range_km: Alcance deseado (km)
+        areal_density: Densidad superficial del reflector (kg/m²)
+        frequency_ghz: Frecuencia de operación (GHz)
+        lim_min_d, lim_max_d: Límites realistas de diámetro de la configuración (m)
 
     Returns:
-        Tuple de (es_válido, lista_errores, lista_advertencias)
+        Tuple de (es_válido, errores, advertencias)
         - es_válido: True si pasa todas las validaciones críticas
-        - lista_errores: Lista de errores críticos que bloquean la ejecución
-        - lista_advertencias: Lista de advertencias que no bloquean pero sugieren problemas
+        - errores: Tupla de errores críticos que bloquean la ejecución
+        - advertencias: Tupla de advertencias que no bloquean pero sugieren problemas
     """
     errors = []
     warnings_list = []
 
-    # Extraer parámetros
-    min_d = user_parameters["min_diameter_m"]
-    max_d = user_parameters["max_diameter_m"]
-    max_weight_g = user_parameters["max_payload_g"]
-    min_fd = user_parameters["min_f_d_ratio"]
-    max_fd = user_parameters["max_f_d_ratio"]
-    range_km = user_parameters["desired_range_km"]
-
-    # --- VALIDACIÓN 1: Rangos lógicos (min <= max) ---
-    if min_d >= max_d:
-        errors.append(
-            f"**Diámetro inválido**: El diámetro mínimo ({min_d:.3f} m) debe ser "
-            f"**menor** que el máximo ({max_d:.3f} m). Por favor, ajuste los valores."
-        )
+    # Valores que aparecen en varios mensajes, formateados una sola vez
+    min_d_txt = f"{min_d:.3f}"
+    max_d_txt = f"{max_d:.2f}"
+    max_d_txt3 = f"{max_d:.3f}"
+    max_weight_txt = f"{max_weight_g:.0f}"
+    min_fd_txt = f"{min_fd:.2f}"
+    max_fd_txt = f"{max_fd:.2f}"
+
+    # Caso común: rangos ordenados y todo positivo; una sola comparación encadenada
+    # evita recorrer las validaciones 1 y 2 cuando no hay nada que reportar
+    if not (0.0 < min_d < max_d and 0.0 < min_fd < max_fd and max_weight_g > 0.0):
+        # --- VALIDACIÓN 1: Rangos lógicos (min <= max) ---
+        if min_d >= max_d:
+            errors.append(
+                f"**Diámetro inválido**: El diámetro mínimo ({min_d_txt} m) debe ser "
+                f"**menor** que el máximo ({max_d_txt3} m). Por favor, ajuste los valores."
+            )
 
-    if min_fd >= max_fd:
-        errors.append(
-            f"**Relación f/D inválida**: El valor mínimo ({min_fd:.2f}) debe ser "
-            f"**menor** que el máximo ({max_fd:.2f}). Por favor, ajuste los valores."
-        )
+        if min_fd >= max_fd:
+            errors.append(
+                f"**Relación f/D inválida**: El valor mínimo ({min_fd_txt}) debe ser "
+                f"**menor** que el máximo ({max_fd_txt}). Por favor, ajuste los valores."
+            )
 
-    # --- VALIDACIÓN 2: Valores positivos ---
-    if min_d <= 0 or max_d <= 0:
-        errors.append(
-            f"**Diámetro inválido**: Los diámetros deben ser **positivos**. "
-            f"Valores actuales: mín={min_d:.3f} m, máx={max_d:.3f} m"
-        )
+        # --- VALIDACIÓN 2: Valores positivos ---
+        if min_d <= 0 or max_d <= 0:
+            errors.append(
+                f"**Diámetro inválido**: Los diámetros deben ser **positivos**. "
+                f"Valores actuales: mín={min_d_txt} m, máx={max_d_txt3} m"
+            )
 
-    if max_weight_g <= 0:
-        errors.append(
-            f"**Peso inválido**: El peso máximo debe ser **positivo**. "
-            f"Valor actual: {max_weight_g:.0f} g"
-        )
+        if max_weight_g <= 0:
+            errors.append(
+                f"**Peso inválido**: El peso máximo debe ser **positivo**. "
+                f"Valor actual: {max_weight_txt} g"
+            )
 
-    if min_fd <= 0 or max_fd <= 0:
-        errors.append(
-            f"**Relación f/D inválida**: Los valores f/D deben ser **positivos**. "
-            f"Valores actuales: mín={min_fd:.2f}, máx={max_fd:.2f}"
-        )
+        if min_fd <= 0 or max_fd <= 0:
+            errors.append(
+                f"**Relación f/D inválida**: Los valores f/D deben ser **positivos**. "
+                f"Valores actuales: mín={min_fd_txt}, máx={max_fd_txt}"
+            )
 
     # Si hay errores básicos, no continuar con validaciones físicas
     if errors:
-        return False, errors, warnings_list
+        return False, tuple(errors), tuple(warnings_list)
 
     # --- VALIDACIÓN 3: Peso vs Diámetro (física básica) ---
-    import numpy as np
-    pi = np.pi
-    areal_density = config.simulation.reflector_areal_density_kg_per_m2
-
-    # Peso mínimo posible con el diámetro mínimo
-    min_area = pi * (min_d / 2) ** 2
-    min_possible_weight_g = min_area * areal_density * 1000
+    # Pesos con los diámetros extremos y diámetro máximo que admite el peso
+    min_possible_weight_g, max_possible_weight_g, feasible_max_d = _geometry_limits(
+        min_d, max_d, max_weight_g, areal_density
+    )
+    feasible_max_d_txt = f"{feasible_max_d:.3f}"
 
     if min_possible_weight_g > max_weight_g:
         # ERROR CRÍTICO: Imposible físicamente
-        feasible_d = 2 * np.sqrt(max_weight_g / 1000 / areal_density / pi)
         errors.append(
             f"**Restricción de peso físicamente imposible**: La antena más pequeña "
-            f"que puedes crear ({min_d:.3f} m) pesaría **{min_possible_weight_g:.1f} g**, "
-            f"pero tu límite de peso es solo **{max_weight_g:.0f} g**.\n\n"
-            f"💡 **Solución**: Reduce el diámetro mínimo a **{feasible_d:.3f} m** o menos, "
+            f"que puedes crear ({min_d_txt} m) pesaría **{min_possible_weight_g:.1f} g**, "
+            f"pero tu límite de peso es solo **{max_weight_txt} g**.\n\n"
+            f"💡 **Solución**: Reduce el diámetro mínimo a **{feasible_max_d_txt} m** o menos, "
             f"O aumenta el peso máximo a **{int(min_possible_weight_g * 1.2)} g** o más."
         )
 
-    # Peso máximo posible con el diámetro máximo
-    max_area = pi * (max_d / 2) ** 2
-    max_possible_weight_g = max_area * areal_density * 1000
-
     # Si el peso máximo permite menos del 30% del rango de diámetros
-    feasible_max_d = 2 * np.sqrt(max_weight_g / 1000 / areal_density / pi)
     if feasible_max_d < max_d:
         usable_range_fraction = (feasible_max_d - min_d) / (max_d - min_d)
 
         if usable_range_fraction < 0.3:
             errors.append(
-                f"**Peso incompatible con rango de diámetros**: Tu peso máximo ({max_weight_g:.0f} g) "
-                f"solo permite antenas de hasta **{feasible_max_d:.3f} m**, pero tu rango "
-                f"va hasta **{max_d:.2f} m**. Esto significa que **{(1-usable_range_fraction)*100:.0f}%** "
+                f"**Peso incompatible con rango de diámetros**: Tu peso máximo ({max_weight_txt} g) "
+                f"solo permite antenas de hasta **{feasible_max_d_txt} m**, pero tu rango "
+                f"va hasta **{max_d_txt} m**. Esto significa que **{(1-usable_range_fraction)*100:.0f}%** "
                 f"de tu rango de diámetros es inaccesible.\n\n"
                 f"💡 **Solución**: Reduce el diámetro máximo a **{feasible_max_d:.2f} m**, "
                 f"O aumenta el peso máximo a **{int(max_possible_weight_g * 1.1)} g**."
@@ -888,8 +1305,8 @@ def validate_user_inputs(user_parameters: dict, config) -> tuple[bool, list[str]
             warnings_list.append(
                 f"⚠️ **Rango de diámetros parcialmente bloqueado**: El peso máximo "
                 f"limita el uso de **{(1-usable_range_fraction)*100:.0f}%** del rango "
-                f"de diámetros. El algoritmo solo puede explorar hasta {feasible_max_d:.3f} m "
-                f"en lugar de {max_d:.2f} m."
+                f"de diámetros. El algoritmo solo puede explorar hasta {feasible_max_d_txt} m "
+                f"en lugar de {max_d_txt} m."
             )
 
     # --- VALIDACIÓN 4: Rangos demasiado estrechos ---
@@ -914,41 +1331,61 @@ def validate_user_inputs(user_parameters: dict, config) -> tuple[bool, list[str]
     if range_km > 15:
         # Estimación aproximada de ganancia necesaria
         approx_gain_needed = 20 + 2 * range_km
-        frequency_ghz = config.simulation.frequency_ghz
         d_needed_for_range = 10**((approx_gain_needed - 7) / 20) / frequency_ghz
 
         if d_needed_for_range > max_d * 1.5:
-            max_gain_achievable = 20 * np.log10(max_d * frequency_ghz * 3.54) + 7
+            max_gain_achievable = 20 * math.log10(max_d * frequency_ghz * 3.54) + 7
             achievable_range = (max_gain_achievable - 20) / 2
 
             warnings_list.append(
                 f"⚠️ **Alcance muy ambicioso**: Para {range_km:.1f} km se necesita "
-                f"una antena de ~{d_needed_for_range:.2f} m, pero tu máximo es {max_d:.2f} m. "
+                f"una antena de ~{d_needed_for_range:.2f} m, pero tu máximo es {max_d_txt} m. "
                 f"El alcance real estimado será ~{achievable_range:.1f} km. "
                 f"Considera reducir el alcance objetivo o aumentar el diámetro máximo."
             )
 
     # --- VALIDACIÓN 6: Valores fuera de rangos realistas ---
-    realistic_limits = config.realistic_limits
-
-    if max_d > realistic_limits.max_diameter_m:
+    if max_d > lim_max_d:
         warnings_list.append(
-            f"⚠️ **Diámetro inusualmente grande**: {max_d:.2f} m excede el límite "
-            f"realista de {realistic_limits.max_diameter_m:.2f} m. "
+            f"⚠️ **Diámetro inusualmente grande**: {max_d_txt} m excede el límite "
+            f"realista de {lim_max_d:.2f} m. "
             f"La optimización continuará, pero verifica que sea intencional."
         )
 
-    if min_d < realistic_limits.min_diameter_m:
+    if min_d < lim_min_d:
         warnings_list.append(
-            f"⚠️ **Diámetro muy pequeño**: {min_d:.3f} m es menor que el mínimo "
-            f"práctico de {realistic_limits.min_diameter_m:.3f} m. "
+            f"⚠️ **Diámetro muy pequeño**: {min_d_txt} m es menor que el mínimo "
+            f"práctico de {lim_min_d:.3f} m. "
             f"Antenas tan pequeñas tendrán ganancia muy baja."
         )
 
     # Validar que hay espacio de búsqueda viable
     is_valid = len(errors) == 0
 
-    return is_valid, errors, warnings_list
+    return is_valid, tuple(errors), tuple(warnings_list)
+
+
+_SAVE_HELP_MD = """
+**Cómo usar los archivos guardados:**
+
+- **Archivo JSON** (o `.json.gz` comprimido): Puede cargarse en la página
+  "📚 Análisis de Sesiones" para comparar múltiples ejecuciones.
+
+- **Archivo CSV**: Puede abrirse en Excel, Google Sheets, o procesarse con
+  pandas/matplotlib para análisis personalizado.
+
+- **Archivo Parquet/Feather**: Se lee con `pandas.read_parquet` /
+  `pandas.read_feather` o con pyarrow, conservando los tipos de columna.
+
+- **Archivo ZIP del frente de Pareto**: Contiene uno o más `.parquet`; puede leerse
+  completo con `pyarrow.dataset` tras descomprimirlo.
+"""
+
+
+@st.fragment
+def _save_help() -> None:
+    """Render the static help for the saved/exported files."""
+    st.info(_SAVE_HELP_MD)
 
 
 def main() -> None:
@@ -983,12 +1420,8 @@ def main() -> None:
             help="Diámetro mínimo y máximo de la antena parabólica en metros",
         )
 
-        # Quick validation feedback for diameter
-        d_range = diameter_range[1] - diameter_range[0]
-        if d_range < 0.1:
-            st.caption("⚠️ Rango muy estrecho. Recomendado: ≥ 0.5 m")
-        elif d_range >= 0.5:
-            st.caption("✅ Rango adecuado para optimización")
+        # Quick validation feedback slots, filled once all sliders are read
+        diameter_hint = st.empty()
 
         # f/D ratio range slider
         fd_range = st.slider(
@@ -1003,12 +1436,7 @@ def main() -> None:
             help="Relación focal/diámetro: determina la profundidad de la parábola",
         )
 
-        # Quick validation feedback for f/D
-        fd_range_width = fd_range[1] - fd_range[0]
-        if fd_range_width < 0.15:
-            st.caption("⚠️ Rango muy limitado. Recomendado: ≥ 0.30")
-        elif fd_range_width >= 0.30:
-            st.caption("✅ Rango adecuado para exploración")
+        fd_hint = st.empty()
 
         st.subheader("Restricciones de Operación")
 
@@ -1022,24 +1450,7 @@ def main() -> None:
             help="Peso máximo permitido para la antena terrestre (incluyendo reflector, alimentador y estructura de soporte)",
         )
 
-        # Quick validation: check if weight is compatible with diameter
-        import numpy as np
-        pi = np.pi
-        areal_density = config.simulation.reflector_areal_density_kg_per_m2
-        min_possible_weight_g = pi * (diameter_range[0] / 2) ** 2 * areal_density * 1000
-
-        if min_possible_weight_g > max_payload:
-            st.caption(
-                f"❌ Peso muy bajo: mínimo necesario ~{int(min_possible_weight_g)} g"
-            )
-        else:
-            feasible_max_d = 2 * np.sqrt(max_payload / 1000 / areal_density / pi)
-            if feasible_max_d < diameter_range[1]:
-                st.caption(
-                    f"⚠️ Peso limita diámetro a ~{feasible_max_d:.2f} m"
-                )
-            else:
-                st.caption(f"✅ Peso compatible con rango de diámetros")
+        weight_hint = st.empty()
 
         # Desired range slider
         desired_range = st.slider(
@@ -1051,15 +1462,28 @@ def main() -> None:
             help="Distancia de comunicación deseada (informativo, no restringe la optimización)",
         )
 
-        # Quick validation: check if range is realistic for antenna size
-        if desired_range > 15:
-            approx_gain_needed = 20 + 2 * desired_range
-            frequency_ghz = config.simulation.frequency_ghz
-            d_needed = 10**((approx_gain_needed - 7) / 20) / frequency_ghz
-            if d_needed > diameter_range[1] * 1.3:
-                st.caption(
-                    f"⚠️ Alcance ambicioso: se recomienda D ≥ {d_needed:.2f} m"
-                )
+        range_hint = st.empty()
+
+        # Quick validation feedback, cached on the slider values. Reruns that
+        # leave every slider untouched reuse the hints kept in session state
+        # and skip the cache lookup altogether.
+        sidebar_key = (
+            diameter_range,
+            fd_range,
+            max_payload,
+            desired_range,
+            config.simulation.reflector_areal_density_kg_per_m2,
+            config.simulation.frequency_ghz,
+        )
+        if st.session_state.get("_sidebar_key") != sidebar_key:
+            st.session_state._sidebar_hints = sidebar_feedback(*sidebar_key)
+            st.session_state._sidebar_key = sidebar_key
+        hints = st.session_state._sidebar_hints
+        for slot, hint in zip(
+            (diameter_hint, fd_hint, weight_hint, range_hint), hints
+        ):
+            if hint:
+                slot.caption(hint)
 
         # Submit button
         submit_button = st.form_submit_button(
@@ -1118,14 +1542,22 @@ def main() -> None:
 
         # --- VALIDACIÓN PREVIA: Verificar parámetros antes de ejecutar ---
         is_valid, validation_errors, validation_warnings = validate_user_inputs(
-            user_parameters, config
+            diameter_range[0],
+            diameter_range[1],
+            max_payload,
+            fd_range[0],
+            fd_range[1],
+            desired_range,
+            config.simulation.reflector_areal_density_kg_per_m2,
+            config.simulation.frequency_ghz,
+            config.realistic_limits.min_diameter_m,
+            config.realistic_limits.max_diameter_m,
         )
 
         # Mostrar advertencias (no bloquean la ejecución)
         if validation_warnings:
             st.warning("### ⚠️ Advertencias de Configuración")
-            for warning in validation_warnings:
-                st.markdown(f"- {warning}")
+            st.markdown("\n\n".join(f"- {warning}" for warning in validation_warnings))
             st.markdown("---")
             st.info(
                 "💡 **Nota**: Estas son advertencias, no errores. La optimización "
@@ -1141,8 +1573,11 @@ def main() -> None:
                 "corregirse antes de ejecutar la optimización:"
             )
 
-            for idx, error in enumerate(validation_errors, 1):
-                st.markdown(f"{idx}. {error}")
+            st.markdown(
+                "\n\n".join(
+                    f"{idx}. {error}" for idx, error in enumerate(validation_errors, 1)
+                )
+            )
 
             st.markdown("---")
             st.info(
@@ -1156,16 +1591,20 @@ def main() -> None:
 
             st.stop()  # Detener ejecución aquí
 
-        # Execute optimization
+        # Execute optimization. The engine is seeded, so resubmitting the
+        # parameters of the result already on screen would only reproduce it
         try:
-            with st.spinner(
-                "⚙️ Ejecutando optimización NSGA-II... Esto puede tardar unos segundos."
-            ):
-                facade = ApplicationFacade()
-                result = facade.run_optimization(user_parameters)
-
-            # Store results in session state
-            st.session_state.result = result
+            if st.session_state.get("result_parameters") != user_parameters:
+                with st.spinner(
+                    "⚙️ Ejecutando optimización NSGA-II... Esto puede tardar unos segundos."
+                ):
+                    facade = _facade()
+                    result = facade.run_optimization(user_parameters)
+
+                # Store results in session state; the id keys cached exports
+                st.session_state.result = result
+                st.session_state.result_id = uuid.uuid4().hex
+                st.session_state.result_parameters = user_parameters
 
         except FacadeValidationError as e:
             st.error("### ❌ Error de Validación del Sistema")
@@ -1203,14 +1642,7 @@ def main() -> None:
                 diagnosis = diagnose_infeasibility(user_parameters, config)
 
                 # Show error with severity-based styling
-                severity_icons = {
-                    "critical": "🔴",
-                    "high": "🟠",
-                    "medium": "🟡",
-                    "unknown": "⚠️",
-                }
-
-                icon = severity_icons.get(diagnosis["severity"], "⚠️")
+                icon = _SEVERITY_ICONS.get(diagnosis["severity"], "⚠️")
 
                 st.markdown(f"---")
                 st.markdown(f"## {icon} Diagnóstico del Problema")
@@ -1255,15 +1687,12 @@ def main() -> None:
                     )
                     st.metric("Alcance Deseado", f"{user_parameters['desired_range_km']:.1f} km")
                 with col3:
-                    # Show constraint tightness
-                    import numpy as np
-                    pi = np.pi
-                    areal_density = config.simulation.reflector_areal_density_kg_per_m2
-                    max_possible_weight = (
-                        pi
-                        * (user_parameters["max_diameter_m"] / 2) ** 2
-                        * areal_density
-                        * 1000
+                    # Show constraint tightness (same cached limits as validate_user_inputs)
+                    _, max_possible_weight, _ = _geometry_limits(
+                        user_parameters["min_diameter_m"],
+                        user_parameters["max_diameter_m"],
+                        user_parameters["max_payload_g"],
+                        config.simulation.reflector_areal_density_kg_per_m2,
                     )
                     weight_utilization = (
                         user_parameters["max_payload_g"] / max_possible_weight * 100
@@ -1302,8 +1731,7 @@ def main() -> None:
                         "**Ajusta los controles de la barra lateral** con los valores recomendados:"
                     )
 
-                    for idx, suggestion in enumerate(diagnosis["suggestions"], 1):
-                        st.markdown(f"{suggestion}")
+                    st.markdown("\n\n".join(diagnosis["suggestions"]))
 
                 st.markdown("---")
 
@@ -1390,15 +1818,17 @@ def main() -> None:
         )
 
         with tab1:
-            st.markdown("#### Evolución del Algoritmo NSGA-II")
             st.markdown(
+                "#### Evolución del Algoritmo NSGA-II\n\n"
                 "Este gráfico muestra cómo la mejor ganancia encontrada mejora a través de las generaciones "
                 "del algoritmo evolutivo."
             )
 
             # Create and display convergence plot
-            convergence_fig = create_convergence_plot(result["convergence"])
-            st.plotly_chart(convergence_fig, use_container_width=True)
+            convergence_fig = result_figure(
+                "convergence", create_convergence_plot, result["convergence"]
+            )
+            st.plotly_chart(convergence_fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
             # Statistics
             col1, col2, col3 = st.columns(3)
@@ -1411,9 +1841,10 @@ def main() -> None:
                 st.metric("Mejora Total", f"{improvement:.2f} dB")
 
         with tab2:
-            st.markdown("#### Frente de Pareto: Trade-offs entre Ganancia y Peso")
             st.markdown(
                 """
+                #### Frente de Pareto: Trade-offs entre Ganancia y Peso
+
                 El **frente de Pareto** muestra todas las soluciones óptimas encontradas por NSGA-II.
                 Cada punto representa una configuración de antena donde no es posible mejorar un objetivo
                 (ganancia o peso) sin empeorar el otro.
@@ -1424,55 +1855,57 @@ def main() -> None:
             )
 
             # Check if pareto_front data is available
-            if "pareto_front" in result and result["pareto_front"]:
+            if pareto_front := result.get("pareto_front"):
                 # Create and display Pareto front plot
-                pareto_fig = create_pareto_front_plot(
-                    result["pareto_front"],
-                    result
+                pareto_fig = result_figure(
+                    "pareto", create_pareto_front_plot, pareto_front, result
                 )
-                st.plotly_chart(pareto_fig, use_container_width=True)
+                st.plotly_chart(pareto_fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
                 # Statistics about the Pareto front
-                st.markdown("---")
-                st.markdown("##### 📈 Estadísticas del Frente de Pareto")
+                st.markdown("---\n\n##### 📈 Estadísticas del Frente de Pareto")
 
-                col1, col2, col3, col4 = st.columns(4)
-
-                pareto_gains = [p.gain for p in result["pareto_front"]]
-                pareto_weights = [p.weight * 1000 for p in result["pareto_front"]]  # Convert to grams
+                # Gain/weight columns in one pass; each min/max is computed once
+                pareto_stats = np.fromiter(
+                    ((p.gain, p.weight) for p in pareto_front),
+                    dtype=_PARETO_STATS_DTYPE,
+                    count=len(pareto_front),
+                )
+                gain_min, gain_max = pareto_stats["gain"].min(), pareto_stats["gain"].max()
+                pareto_weights_g = pareto_stats["weight"] * 1000.0  # Convert to grams
+                weight_min, weight_max = pareto_weights_g.min(), pareto_weights_g.max()
 
-                with col1:
-                    st.metric(
+                # One table instead of four metric widgets
+                pareto_stats_data = {
+                    "Métrica": [
                         "Soluciones Encontradas",
-                        f"{len(result['pareto_front'])}",
-                        help="Número total de soluciones óptimas en el frente de Pareto"
-                    )
-
-                with col2:
-                    st.metric(
                         "Rango de Ganancia",
-                        f"{min(pareto_gains):.1f} - {max(pareto_gains):.1f} dBi",
-                        help="Rango de ganancias disponibles en las soluciones óptimas"
-                    )
-
-                with col3:
-                    st.metric(
                         "Rango de Peso",
-                        f"{min(pareto_weights):.0f} - {max(pareto_weights):.0f} g",
-                        help="Rango de pesos disponibles en las soluciones óptimas"
+                    ],
+                    "Valor": [
+                        f"{len(pareto_front)}",
+                        f"{gain_min:.1f} - {gain_max:.1f} dBi",
+                        f"{weight_min:.0f} - {weight_max:.0f} g",
+                    ],
+                    "Descripción": [
+                        "Número total de soluciones óptimas en el frente de Pareto",
+                        "Rango de ganancias disponibles en las soluciones óptimas",
+                        "Rango de pesos disponibles en las soluciones óptimas",
+                    ],
+                }
+
+                # Calculate trade-off ratio
+                gain_range = gain_max - gain_min
+                weight_range = weight_max - weight_min
+                if weight_range > 0:
+                    tradeoff = gain_range / weight_range
+                    pareto_stats_data["Métrica"].append("Trade-off")
+                    pareto_stats_data["Valor"].append(f"{tradeoff:.3f} dBi/g")
+                    pareto_stats_data["Descripción"].append(
+                        "Ganancia adicional por gramo de peso añadido"
                     )
 
-                with col4:
-                    # Calculate trade-off ratio
-                    gain_range = max(pareto_gains) - min(pareto_gains)
-                    weight_range = max(pareto_weights) - min(pareto_weights)
-                    if weight_range > 0:
-                        tradeoff = gain_range / weight_range
-                        st.metric(
-                            "Trade-off",
-                            f"{tradeoff:.3f} dBi/g",
-                            help="Ganancia adicional por gramo de peso añadido"
-                        )
+                st.table(pareto_stats_data)
 
                 st.markdown("---")
                 st.info(
@@ -1491,25 +1924,24 @@ def main() -> None:
                 st.warning("No hay datos del frente de Pareto disponibles para esta optimización.")
 
         with tab3:
-            st.markdown("#### Especificaciones Geométricas Completas")
-
             # Parabola geometry visualization
-            st.markdown("##### 📐 Visualización de la Geometría")
             st.markdown(
+                "#### Especificaciones Geométricas Completas\n\n"
+                "##### 📐 Visualización de la Geometría\n\n"
                 "Este diagrama muestra el perfil de corte de la antena parabólica con sus dimensiones clave:"
             )
 
-            parabola_fig = create_parabola_geometry_plot(
+            parabola_fig = result_figure(
+                "parabola",
+                create_parabola_geometry_plot,
                 result["optimal_diameter_mm"],
                 result["optimal_focal_length_mm"],
                 result["optimal_depth_mm"],
             )
-            st.plotly_chart(parabola_fig, use_container_width=True)
-
-            st.markdown("---")
+            st.plotly_chart(parabola_fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
             # Geometry table
-            st.markdown("##### 📏 Tabla de Dimensiones")
+            st.markdown("---\n\n##### 📏 Tabla de Dimensiones")
             geometry_data = {
                 "Parámetro": [
                     "Diámetro de Apertura",
@@ -1536,101 +1968,111 @@ def main() -> None:
             # Performance metrics table
             st.markdown("#### Métricas de Rendimiento RF")
 
-            performance_data = {
-                "Métrica": [
-                    "Ganancia Directiva",
-                    "Ancho de Haz (HPBW)",
-                    "Frecuencia de Operación",
-                    "Eficiencia de Apertura",
-                ],
-                "Valor": [
-                    f"{result['expected_gain_dbi']:.2f} dBi",
-                    f"{result['beamwidth_deg']:.2f}°",
-                    f"{config.simulation.frequency_ghz:.1f} GHz",
-                    f"{config.simulation.aperture_efficiency * 100:.0f}%",
-                ],
-            }
+            performance_data = performance_rows(
+                result["expected_gain_dbi"],
+                result["beamwidth_deg"],
+                config.simulation.frequency_ghz,
+                config.simulation.aperture_efficiency,
+            )
 
             st.table(performance_data)
 
-            # JSON export option
+            # JSON export option: the full tree (convergence, Pareto front) is
+            # only sent to the browser once the user asks for it
             with st.expander("🔍 Ver Datos Completos (JSON)"):
-                st.json(result)
+                if st.toggle("Mostrar JSON completo", key="show_full_json"):
+                    st.json(result)
 
         with tab4:
-            st.markdown("#### Opciones de Guardado y Exportación")
-
             # Session save section
-            st.markdown("##### 💾 Guardar Sesión Completa")
             st.markdown(
+                "#### Opciones de Guardado y Exportación\n\n"
+                "##### 💾 Guardar Sesión Completa\n\n"
                 "Guarde los parámetros de entrada y resultados en formato JSON para análisis posterior."
             )
 
-            # Prepare session data for JSON serialization
-            # Convert ParetoPoint objects to dictionaries
-            result_copy = dict(st.session_state.result)
-            if "pareto_front" in result_copy and result_copy["pareto_front"]:
-                result_copy["pareto_front"] = [
-                    {
-                        "diameter": p.diameter,
-                        "f_d_ratio": p.f_d_ratio,
-                        "gain": p.gain,
-                        "weight": p.weight,
-                    }
-                    for p in result_copy["pareto_front"]
-                ]
-
-            session_data = {
-                "params": st.session_state.user_parameters,
-                "results": result_copy,
-            }
-
-            session_json = json.dumps(session_data, indent=2, ensure_ascii=False)
-
-            st.download_button(
-                label="📥 Descargar Sesión (.json)",
-                data=session_json,
-                file_name="soga_session.json",
-                mime="application/json",
-                use_container_width=True,
+            # Serialization is deferred until the button is clicked and then
+            # cached per optimization result
+            session_args = (
+                st.session_state.result_id,
+                st.session_state.user_parameters,
+                st.session_state.result,
             )
-
-            st.markdown("---")
+            json_col, gz_col = st.columns(2)
+            with json_col:
+                st.download_button(
+                    label="📥 Descargar Sesión (.json)",
+                    data=functools.partial(serialize_session, *session_args),
+                    file_name="soga_session.json",
+                    mime="application/json",
+                    use_container_width=True,
+                )
+            with gz_col:
+                st.download_button(
+                    label="📥 Descargar Sesión comprimida (.json.gz)",
+                    data=functools.partial(serialize_session_gz, *session_args),
+                    file_name="soga_session.json.gz",
+                    mime="application/gzip",
+                    use_container_width=True,
+                )
 
             # Convergence export section
-            st.markdown("##### 📊 Exportar Historial de Convergencia")
             st.markdown(
-                "Exporte el historial de convergencia en formato CSV para análisis en Excel, Python, etc."
+                "---\n\n##### 📊 Exportar Historial de Convergencia\n\n"
+                "Exporte el historial de convergencia en formato CSV para análisis en Excel, "
+                "o en Parquet/Feather (más compactos y rápidos de leer) para Python, R, etc."
             )
 
-            try:
-                convergence_csv = export_convergence_to_bytes(result["convergence"])
+            convergence_format = st.radio(
+                "Formato",
+                list(_CONVERGENCE_FORMATS),
+                horizontal=True,
+                key="convergence_format",
+            )
+            extension, mime, arrow_format = _CONVERGENCE_FORMATS[convergence_format]
 
+            # The file is also built on click; only the empty-history case can
+            # fail, so it is checked up front
+            if len(result["convergence"]) == 0:
+                st.error(
+                    "Error al exportar convergencia: El historial de convergencia está vacío"
+                )
+            else:
+                if arrow_format is None:
+                    convergence_data = functools.partial(
+                        export_convergence_to_bytes, result["convergence"]
+                    )
+                else:
+                    convergence_data = functools.partial(
+                        export_convergence_to_arrow, result["convergence"], arrow_format
+                    )
                 st.download_button(
-                    label="📥 Descargar Convergencia (.csv)",
-                    data=convergence_csv,
-                    file_name="soga_convergence.csv",
-                    mime="text/csv",
+                    label=f"📥 Descargar Convergencia (.{extension})",
+                    data=convergence_data,
+                    file_name=f"soga_convergence.{extension}",
+                    mime=mime,
                     use_container_width=True,
                 )
 
-            except Exception as e:
-                st.error(f"Error al exportar convergencia: {e}")
+            # Pareto front export section (only when the run produced one)
+            if pareto_front := result.get("pareto_front"):
+                st.markdown(
+                    "---\n\n##### 🎯 Exportar Frente de Pareto\n\n"
+                    "Exporte todas las soluciones del frente de Pareto como archivos Parquet "
+                    "(hasta 10 000 puntos cada uno) empaquetados en un ZIP."
+                )
+                st.download_button(
+                    label="📥 Descargar Frente de Pareto (.zip)",
+                    data=functools.partial(export_pareto_to_zip, pareto_front),
+                    file_name="soga_pareto_front.zip",
+                    mime="application/zip",
+                    use_container_width=True,
+                )
 
             st.markdown("---")
 
             # Instructions
-            st.info(
-                """
-                **Cómo usar los archivos guardados:**
-
-                - **Archivo JSON**: Puede cargarse en la página "📚 Análisis de Sesiones" para
-                  comparar múltiples ejecuciones.
-
-                - **Archivo CSV**: Puede abrirse en Excel, Google Sheets, o procesarse con
-                  pandas/matplotlib para análisis personalizado.
-                """
-            )
+            _save_help()
 
 
 if __name__ == "__main__":
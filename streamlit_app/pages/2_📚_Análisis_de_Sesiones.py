@@ -9,6 +9,7 @@ Author: SOGA Development Team
 License: MIT
 """
 
+import gzip
 import io
 import json
 import sys
@@ -39,6 +40,40 @@ def initialize_session_state() -> None:
         st.session_state.loaded_sessions = []
 
 
+@st.cache_data(show_spinner=False)
+def parse_session_bytes(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse and validate session JSON content (plain or gzip), cached by file content.
+
+    Re-uploading the same file (or reloading it after clearing the list)
+    reuses the parsed result instead of decoding the JSON again.
+
+    Args:
+        raw: Raw bytes of the uploaded session file
+
+    Returns:
+        Dictionary with session data
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+        ValueError: If content doesn't have required structure
+    """
+    # Compressed sessions (.json.gz) are recognised by the gzip magic number
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+
+    data = json.loads(raw)
+
+    # Validate structure
+    if "params" not in data or "results" not in data:
+        raise ValueError(
+            "El archivo JSON no tiene la estructura correcta. "
+            "Debe contener 'params' y 'results'."
+        )
+
+    return data
+
+
 def load_session_file(uploaded_file) -> Dict[str, Any]:
     """
     Load and parse a session JSON file.
@@ -54,16 +89,7 @@ def load_session_file(uploaded_file) -> Dict[str, Any]:
         ValueError: If file doesn't have required structure
     """
     try:
-        data = json.load(uploaded_file)
-
-        # Validate structure
-        if "params" not in data or "results" not in data:
-            raise ValueError(
-                "El archivo JSON no tiene la estructura correcta. "
-                "Debe contener 'params' y 'results'."
-            )
-
-        return data
+        return parse_session_bytes(uploaded_file.getvalue())
 
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Error al parsear JSON: {e.msg}", e.doc, e.pos)
@@ -200,12 +226,12 @@ def main() -> None:
     # Sidebar - File Upload
     st.sidebar.header("📂 Cargar Sesiones")
     st.sidebar.markdown(
-        "Suba uno o más archivos `.json` generados en la página de optimización."
+        "Suba uno o más archivos `.json` (o `.json.gz`) generados en la página de optimización."
     )
 
     uploaded_files = st.sidebar.file_uploader(
         "Seleccionar archivos de sesión",
-        type=["json"],
+        type=["json", "gz"],
         accept_multiple_files=True,
         key="session_uploader",
         help="Puede seleccionar múltiples archivos manteniendo Ctrl (Windows/Linux) o Cmd (Mac)",
@@ -4,6 +4,7 @@ from soga.core.models import (
     PerformanceMetrics,
     OptimizationConstraints,
     OptimizationResult,
+    ParetoPoint,
 )
 
 
@@ -202,6 +203,16 @@ class TestOptimizationConstraints:
             )
 
 
+class TestParetoPoint:
+    """Tests para la clase ParetoPoint."""
+
+    def test_pareto_point_uses_slots(self):
+        """Prueba que ParetoPoint no tiene __dict__ por instancia."""
+        point = ParetoPoint(diameter=0.5, f_d_ratio=0.45, gain=20.0, weight=0.3)
+        assert point.gain == 20.0
+        assert not hasattr(point, "__dict__")
+
+
 class TestOptimizationResult:
     """Tests para la clase OptimizationResult."""
 
@@ -1,6 +1,8 @@
 """Tests para el módulo infrastructure.config."""
 
+import pickle
 import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -8,6 +10,7 @@ import pytest
 from soga.infrastructure.config import (
     AppConfig,
     ConfigLoader,
+    LinkBudgetConfig,
     OptimizationConfig,
     PhysicsConfig,
     RegulatoryConfig,
@@ -126,6 +129,21 @@ speed_of_light = 299792458.0
             f.write(incomplete_config)
             temp_path = Path(f.name)
 
+        try:
+            with pytest.raises(ValueError, match="Faltan secciones requeridas"):
+                ConfigLoader.load(temp_path)
+        finally:
+            temp_path.unlink()
+
+    def test_load_unknown_key_raises_error(self, valid_config_content):
+        """Prueba que una clave desconocida en una sección lanza ValueError."""
+        content = valid_config_content.replace(
+            "[regulatory]\n", "[regulatory]\nunknown_key = 1.0\n"
+        )
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write(content)
+            temp_path = Path(f.name)
+
         try:
             with pytest.raises(ValueError, match="Configuración inválida"):
                 ConfigLoader.load(temp_path)
@@ -189,6 +207,34 @@ class TestConfigDataclasses:
         reg = RegulatoryConfig(max_eirp_dbm=36.0)
         assert reg.max_eirp_dbm == 36.0
 
+    def test_link_budget_config_out_of_range_raises_error(self):
+        """Prueba que un parámetro de link budget fuera de rango lanza ValueError."""
+        with pytest.raises(ValueError, match="Margen de fade fuera de rango"):
+            LinkBudgetConfig(
+                tx_power_dbm=20.0,
+                rx_sensitivity_dbm=-95.0,
+                rx_noise_figure_db=6.0,
+                required_snr_db=10.0,
+                fade_margin_db=45.0,
+                implementation_loss_db=3.0,
+                min_link_margin_db=6.0,
+            )
+
+    def test_config_is_immutable(self):
+        """Prueba que las dataclasses de configuración son inmutables."""
+        physics = PhysicsConfig(speed_of_light=299792458.0)
+        with pytest.raises(FrozenInstanceError):
+            physics.speed_of_light = 1.0
+        assert not hasattr(physics, "__dict__")
+
+    def test_config_pickle_roundtrip(self, temp_config_file):
+        """Prueba que AppConfig se reconstruye desde pickle sin revalidar."""
+        config = ConfigLoader.load(temp_config_file)
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        assert restored.link_budget.fade_margin_db == 10.0
+
     def test_app_config_complete(self, temp_config_file):
         """Prueba que AppConfig contiene todas las secciones."""
         config = ConfigLoader.load(temp_config_file)
@@ -1,14 +1,23 @@
 """Tests para el módulo infrastructure.file_io."""
 
+import base64
 import csv
+import io
 import json
+import os
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from soga.core.models import AntennaGeometry, OptimizationResult, PerformanceMetrics
-from soga.infrastructure.file_io import SessionManager, ResultsExporter
+from soga.infrastructure import file_io
+from soga.infrastructure.file_io import (
+    ResultsExporter,
+    SessionManager,
+    _load_session_cached,
+)
 
 
 @pytest.fixture
@@ -84,11 +93,30 @@ class TestSessionManager:
             assert data["results"]["performance"]["gain"] == 35.0
             assert data["results"]["performance"]["beamwidth"] == 2.5
 
-            # Verificar historial
-            assert data["results"]["convergence_history"] == [30.0, 32.0, 34.0, 35.0]
+            # Verificar historial (float64 empaquetado en base64)
+            packed = base64.b64decode(data["results"]["convergence_history_b64"])
+            history = np.frombuffer(packed, dtype="<f8").tolist()
+            assert history == [30.0, 32.0, 34.0, 35.0]
         finally:
             temp_path.unlink()
 
+    def test_save_session_failure_keeps_previous_file(
+        self, sample_user_params, sample_result
+    ):
+        """Prueba que un guardado fallido no corrompe la sesión existente."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_path = Path(tmp_dir) / "session.json"
+            SessionManager.save_session(temp_path, sample_user_params, sample_result)
+            original = temp_path.read_bytes()
+
+            with pytest.raises(IOError, match="Error al guardar"):
+                SessionManager.save_session(
+                    temp_path, {"invalid": object()}, sample_result
+                )
+
+            assert temp_path.read_bytes() == original
+            assert list(Path(tmp_dir).iterdir()) == [temp_path]
+
     def test_load_session_reads_file(self, sample_user_params, sample_result):
         """Prueba que load_session lee correctamente un archivo."""
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
@@ -107,6 +135,45 @@ class TestSessionManager:
         finally:
             temp_path.unlink()
 
+    def test_load_session_cached_reuses_until_modified(
+        self, sample_user_params, sample_result
+    ):
+        """Prueba que la caché se reutiliza y se invalida al cambiar el archivo."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_path = Path(tmp_dir) / "session.json"
+            SessionManager.save_session(temp_path, sample_user_params, sample_result)
+
+            hits = _load_session_cached.cache_info().hits
+            first = SessionManager.load_session_cached(temp_path)
+            assert SessionManager.load_session_cached(temp_path) == first
+            assert _load_session_cached.cache_info().hits == hits + 1
+
+            modified_params = dict(sample_user_params, max_payload_g=1500.0)
+            SessionManager.save_session(temp_path, modified_params, sample_result)
+            stat = temp_path.stat()
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            reloaded = SessionManager.load_session_cached(temp_path)
+            assert reloaded["user_parameters"]["max_payload_g"] == 1500.0
+
+    def test_load_session_cached_returns_independent_copies(
+        self, sample_user_params, sample_result
+    ):
+        """Prueba que modificar la sesión devuelta no altera la caché."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_path = Path(tmp_dir) / "session.json"
+            SessionManager.save_session(temp_path, sample_user_params, sample_result)
+
+            first = SessionManager.load_session_cached(temp_path)
+            first["extra"] = True
+            first["user_parameters"]["max_payload_g"] = -1.0
+            del first["results"]
+
+            second = SessionManager.load_session_cached(temp_path)
+            assert "extra" not in second
+            assert second["user_parameters"] == sample_user_params
+            assert "results" in second
+
     def test_load_session_nonexistent_raises_error(self):
         """Prueba que cargar un archivo inexistente lanza FileNotFoundError."""
         nonexistent = Path("/tmp/nonexistent_session_12345.json")
@@ -164,6 +231,57 @@ class TestSessionManager:
         finally:
             temp_path.unlink()
 
+    def test_reconstruct_result_legacy_list_history(self):
+        """Prueba que se leen sesiones antiguas con historial en lista."""
+        legacy_data = {
+            "user_parameters": {},
+            "results": {
+                "geometry": {"diameter": 1.0, "focal_length": 0.5},
+                "performance": {"gain": 35.0, "beamwidth": 2.5},
+                "convergence_history": [30.0, 32.0],
+            },
+        }
+
+        reconstructed = SessionManager.reconstruct_result(legacy_data)
+
+        assert reconstructed.convergence_history == [30.0, 32.0]
+
+    def test_save_session_fast_roundtrip(self, sample_user_params, sample_result):
+        """Prueba que el formato binario rápido conserva la sesión."""
+        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
+            temp_path = Path(f.name)
+
+        try:
+            SessionManager.save_session_fast(
+                temp_path, sample_user_params, sample_result
+            )
+            params, result = SessionManager.load_session_fast(temp_path)
+
+            assert params == sample_user_params
+            assert result.optimal_geometry.diameter == 1.0
+            assert result.performance_metrics.gain == 35.0
+            assert result.convergence_history == [30.0, 32.0, 34.0, 35.0]
+        finally:
+            temp_path.unlink()
+
+    def test_load_session_fast_truncated_raises_error(
+        self, sample_user_params, sample_result
+    ):
+        """Prueba que un archivo binario truncado lanza ValueError."""
+        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
+            temp_path = Path(f.name)
+
+        try:
+            SessionManager.save_session_fast(
+                temp_path, sample_user_params, sample_result
+            )
+            temp_path.write_bytes(temp_path.read_bytes()[:-8])
+
+            with pytest.raises(ValueError, match="Sesión binaria inválida"):
+                SessionManager.load_session_fast(temp_path)
+        finally:
+            temp_path.unlink()
+
     def test_reconstruct_result_invalid_data_raises_error(self):
         """Prueba que datos inválidos lanzan ValueError."""
         invalid_data = {"results": {"wrong": "structure"}}
@@ -271,6 +389,28 @@ class TestResultsExporter:
             if temp_path.exists():
                 temp_path.unlink()
 
+    def test_export_to_csv_missing_keys_writes_nothing(self):
+        """Prueba que una fila incompleta no deja un archivo a medio escribir."""
+        results = [
+            {
+                "diameter_mm": 500.0,
+                "focal_length_mm": 225.0,
+                "depth_mm": 69.44,
+                "f_d_ratio": 0.45,
+                "gain_dbi": 28.5,
+                "beamwidth_deg": 4.2,
+            },
+            {"diameter_mm": 800.0},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_path = Path(tmp_dir) / "results.csv"
+
+            with pytest.raises(ValueError, match="Faltan claves"):
+                ResultsExporter.export_to_csv(results, temp_path)
+
+            assert not temp_path.exists()
+
     def test_export_convergence_to_csv_creates_file(self):
         """Prueba que export_convergence_to_csv crea un archivo."""
         history = [25.5, 26.1, 26.8, 27.2, 27.5]
@@ -294,6 +434,68 @@ class TestResultsExporter:
         finally:
             temp_path.unlink()
 
+    def test_export_convergence_to_csv_accepts_ndarray(self):
+        """Prueba que export_convergence_to_csv acepta arrays de NumPy."""
+        history = np.array([25.5, 26.1, 26.8])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_path = Path(tmp_dir) / "convergence.csv"
+            ResultsExporter.export_convergence_to_csv(history, temp_path)
+
+            with open(temp_path, "r", newline="") as f:
+                rows = list(csv.reader(f))
+
+        assert rows[0] == ["generation", "best_gain_dbi"]
+        assert [int(row[0]) for row in rows[1:]] == [0, 1, 2]
+        assert float(rows[3][1]) == pytest.approx(26.8)
+
+    def test_export_to_json_bytes_roundtrip(self):
+        """Prueba que export_to_json_bytes produce JSON UTF-8 legible."""
+        data = {"params": {"desired_range_km": 5.0}, "results": {"nota": "ganancia óptima"}}
+
+        payload = ResultsExporter.export_to_json_bytes(data)
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload.decode("utf-8")) == data
+
+    def test_export_to_json_bytes_fallback_matches_orjson(self, monkeypatch):
+        """Prueba que json estándar y orjson producen el mismo documento."""
+        orjson = pytest.importorskip("orjson")
+        data = {
+            "nan": float("nan"),
+            "inf": [float("-inf"), 1.5],
+            "array": np.array([1.0, np.nan]),
+            "scalars": (np.int64(3), np.float32(0.5), np.bool_(True)),
+        }
+
+        fast = ResultsExporter.export_to_json_bytes(data)
+        monkeypatch.setattr(file_io, "orjson", None)
+        fallback = ResultsExporter.export_to_json_bytes(data)
+
+        expected = {
+            "nan": None,
+            "inf": [None, 1.5],
+            "array": [1.0, None],
+            "scalars": [3, 0.5, True],
+        }
+        assert orjson.loads(fast) == expected
+        assert json.loads(fallback) == expected
+
+    def test_export_to_json_bytes_unserializable_raises_error(self):
+        """Prueba que datos no serializables lanzan ValueError."""
+        with pytest.raises(ValueError, match="no serializables"):
+            ResultsExporter.export_to_json_bytes({"obj": object()})
+
+    def test_export_convergence_to_csv_writes_to_text_buffer(self):
+        """Prueba que export_convergence_to_csv acepta un buffer en memoria."""
+        buffer = io.StringIO()
+
+        ResultsExporter.export_convergence_to_csv([25.5, 26.0], buffer)
+
+        assert buffer.getvalue() == (
+            "generation,best_gain_dbi\r\n0,25.500000\r\n1,26.000000\r\n"
+        )
+
     def test_export_convergence_empty_raises_error(self):
         """Prueba que un historial vacío lanza ValueError."""
         with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f: